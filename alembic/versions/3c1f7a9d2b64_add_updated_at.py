@@ -0,0 +1,48 @@
+"""Add updated_at to meetings and tasks
+
+Revision ID: 3c1f7a9d2b64
+Revises: 97f80507c587
+Create Date: 2025-03-02 10:41:27.513204
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1f7a9d2b64"
+down_revision: Union[str, None] = "97f80507c587"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "meetings",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+    )
+    op.create_index("ix_meeting_updated_at", "meetings", ["updated_at"], unique=False)
+    op.add_column(
+        "tasks",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+    )
+    op.create_index("ix_task_updated_at", "tasks", ["updated_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_updated_at", table_name="tasks")
+    op.drop_column("tasks", "updated_at")
+    op.drop_index("ix_meeting_updated_at", table_name="meetings")
+    op.drop_column("meetings", "updated_at")
@@ -0,0 +1,42 @@
+"""Store outbox messages as bytes
+
+Revision ID: b7d5e1c9a402
+Revises: 8e4b2d6f1a93
+Create Date: 2025-03-11 09:27:40.662915
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d5e1c9a402"
+down_revision: Union[str, None] = "8e4b2d6f1a93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "outbox",
+        "message",
+        existing_type=sa.String(),
+        type_=sa.LargeBinary(),
+        existing_nullable=False,
+        postgresql_using="convert_to(message, 'UTF8')",
+    )
+
+
+def downgrade() -> None:
+    # Only JSON-encoded messages survive the conversion back to text
+    op.alter_column(
+        "outbox",
+        "message",
+        existing_type=sa.LargeBinary(),
+        type_=sa.String(),
+        existing_nullable=False,
+        postgresql_using="convert_from(message, 'UTF8')",
+    )
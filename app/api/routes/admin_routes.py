@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.core.decorators import log_execution_time
+from app.core.dependencies import get_dead_letter_queue
+from app.core.logging_config import logger
+from app.events.dead_letter import DeadLetterQueue
+from app.exceptions import handle_service_exceptions
+from app.schemas.admin_schemas import DeadLetter, DeadLetterReplayResult
+
+router = APIRouter()
+
+
+@router.get("/dead-letters", response_model=list[DeadLetter])
+@log_execution_time
+async def get_dead_letters(
+    limit: int = Query(100, ge=1, le=1000),
+    dead_letters: DeadLetterQueue = Depends(get_dead_letter_queue),
+) -> list[DeadLetter]:
+    logger.info(f"Fetching up to {limit} dead-lettered events")
+    return await dead_letters.peek(limit)
+
+
+@router.post("/dead-letters/replay", response_model=DeadLetterReplayResult)
+@handle_service_exceptions
+@log_execution_time
+async def replay_dead_letters(
+    limit: int = Query(1000, ge=1, le=100_000),
+    dead_letters: DeadLetterQueue = Depends(get_dead_letter_queue),
+) -> DeadLetterReplayResult:
+    logger.info(f"Replaying up to {limit} dead-lettered events")
+    replayed = await dead_letters.replay(limit)
+    return DeadLetterReplayResult(
+        replayed=replayed, remaining=await dead_letters.size()
+    )
+
+
+@router.delete("/dead-letters")
+@handle_service_exceptions
+@log_execution_time
+async def purge_dead_letters(
+    dead_letters: DeadLetterQueue = Depends(get_dead_letter_queue),
+) -> dict:
+    purged = await dead_letters.purge()
+    logger.warning(f"Purged {purged} dead-lettered events")
+    return {"purged": purged}
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends, UploadFile
+
+from app.core.decorators import log_execution_time
+from app.core.dependencies import get_import_service
+from app.core.logging_config import logger
+from app.exceptions import handle_service_exceptions
+from app.schemas.import_schemas import ImportFormat, ImportKind, ImportResult
+from app.services.import_service import ImportService
+
+router = APIRouter()
+
+
+@router.post("/{kind}", response_model=ImportResult)
+@handle_service_exceptions
+@log_execution_time
+async def import_rows(
+    kind: ImportKind,
+    file: UploadFile,
+    fmt: ImportFormat = ImportFormat.NDJSON,
+    service: ImportService = Depends(get_import_service),
+) -> ImportResult:
+    logger.info(f"Importing {kind.value} from {file.filename} as {fmt.value}")
+    return await service.import_rows(kind, fmt, file.file)
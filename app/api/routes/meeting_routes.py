@@ -1,4 +1,8 @@
+from datetime import datetime
+from typing import Optional
+
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 
 from app.core.decorators import log_execution_time
 from app.core.dependencies import get_meeting_service
@@ -12,6 +16,7 @@ from app.schemas.meeting_schemas import (
 )
 from app.schemas.user_schemas import AddUsersRequest
 from app.services.meeting_service import MeetingService
+from app.utils.ndjson import ndjson_response
 
 router = APIRouter()
 
@@ -40,6 +45,20 @@ async def get_meetings(
     return result
 
 
+@router.get("/export", response_class=StreamingResponse)
+@log_execution_time
+async def export_meetings(
+    updated_since: Optional[datetime] = None,
+    start_after: Optional[datetime] = None,
+    start_before: Optional[datetime] = None,
+    service: MeetingService = Depends(get_meeting_service),
+) -> StreamingResponse:
+    logger.info("Exporting meetings as NDJSON")
+    return ndjson_response(
+        service.export_meetings(updated_since, start_after, start_before)
+    )
+
+
 @router.get("/{meeting_id}", response_model=MeetingRetrieve)
 @log_execution_time
 async def get_meeting(
@@ -1,4 +1,8 @@
+from datetime import datetime
+from typing import Optional
+
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 
 from app.core.decorators import log_execution_time
 from app.core.dependencies import get_task_service
@@ -6,6 +10,7 @@ from app.core.logging_config import logger
 from app.exceptions import NotFoundError, handle_service_exceptions
 from app.schemas.task_schemas import TaskCreate, TaskRetrieve, TaskUpdate
 from app.services.task_service import TaskService
+from app.utils.ndjson import ndjson_response
 
 router = APIRouter()
 
@@ -31,6 +36,18 @@ async def get_tasks(
     return result
 
 
+@router.get("/export", response_class=StreamingResponse)
+@log_execution_time
+async def export_tasks(
+    updated_since: Optional[datetime] = None,
+    due_after: Optional[datetime] = None,
+    due_before: Optional[datetime] = None,
+    service: TaskService = Depends(get_task_service),
+) -> StreamingResponse:
+    logger.info("Exporting tasks as NDJSON")
+    return ndjson_response(service.export_tasks(updated_since, due_after, due_before))
+
+
 @router.get("/{task_id}", response_model=TaskRetrieve)
 @log_execution_time
 async def get_task(
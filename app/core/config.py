@@ -1,23 +1,52 @@
 import os
 
 from dotenv import load_dotenv
-from pydantic import ConfigDict
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Load environment variables from .env file
 load_dotenv()
 
 
 class Settings(BaseSettings):
-    model_config = ConfigDict(from_attributes=True)
+    # Automatically load values from `.env`
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
     TEST_DATABASE_URL: str = "sqlite+aiosqlite:///./test.db"
     DATABASE_URL: str = "sqlite:///./test.db"
     SECRET_KEY: str = os.getenv("SECRET_KEY", "default_secret_key")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
-
-    class Config:
-        env_file = ".env"  # Automatically load values from `.env`
+    EXPORT_YIELD_PER: int = 1000
+    IMPORT_CHUNK_SIZE: int = 5000
+    IMPORT_MAX_REJECTS: int = 1000
+    SUBSCRIBER_CONCURRENCY: int = 8
+    SUBSCRIBER_QUEUE_SIZE: int = 100
+    SUBSCRIBER_BATCH_SIZE: int = 50
+    SUBSCRIBER_MAX_ATTEMPTS: int = 3
+    SUBSCRIBER_RETRY_DELAY_MS: int = 100
+    SUBSCRIBER_RECONNECT_BASE_MS: int = 500
+    SUBSCRIBER_RECONNECT_MAX_MS: int = 30_000
+    DEAD_LETTER_KEY: str = "events:dead-letter"
+    DEAD_LETTER_MAX_LEN: int = 10_000
+    USER_BATCH_SIZE: int = 500
+    USER_BATCH_MAX_DELAY_MS: int = 50
+    EVENT_BUS: str = "redis"  # "redis" or "memory"
+    EVENT_OUTBOX_ENABLED: bool = True
+    OUTBOX_BATCH_SIZE: int = 500
+    OUTBOX_POLL_INTERVAL_MS: int = 500
+    OUTBOX_RETENTION_HOURS: int = 24
+    EVENT_PUBLISH_QUEUE_SIZE: int = 10_000
+    EVENT_PUBLISH_BATCH_SIZE: int = 100
+    EVENT_PUBLISH_OVERFLOW: str = "block"  # "block", "drop_oldest" or "spill"
+    EVENT_PUBLISH_SPILL_PATH: str = "logs/event_spill.ndjson"
+    EVENT_CODEC: str = "json"  # "json" or "msgpack"
+    EVENT_DEDUP_TTL_SECONDS: int = 24 * 60 * 60
+    EVENT_DEDUP_LOCAL_SIZE: int = 100_000
+    EVENT_TRANSPORT: str = "pubsub"  # "pubsub" or "streams"
+    EVENT_CONSUMER_GROUP: str = "meeting-service"
+    EVENT_STREAM_MAXLEN: int = 100_000
+    EVENT_STREAM_BATCH_SIZE: int = 100
+    EVENT_STREAM_BLOCK_MS: int = 5000
+    EVENT_STREAM_CLAIM_IDLE_MS: int = 60_000
 
 
 settings = Settings()
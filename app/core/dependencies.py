@@ -1,12 +1,15 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.redis_client import redis_client
+from app.core.redis_client import binary_redis_client, redis_client
 from app.db.db import get_db
+from app.db.repositories.import_repo import ImportRepository
 from app.db.repositories.meeting_repo import MeetingRepository
 from app.db.repositories.recurrence_repo import RecurrenceRepository
 from app.db.repositories.task_repo import TaskRepository
 from app.db.repositories.user_repo import UserRepository
+from app.events.dead_letter import DeadLetterQueue
+from app.services.import_service import ImportService
 from app.services.meeting_service import MeetingService
 from app.services.recurrence_service import RecurrenceService
 from app.services.task_service import TaskService
@@ -17,6 +20,10 @@ def get_redis_client():
     return redis_client
 
 
+def get_binary_redis_client():
+    return binary_redis_client
+
+
 def get_meeting_repo(db: AsyncSession = Depends(get_db)) -> MeetingRepository:
     return MeetingRepository(db)
 
@@ -61,3 +68,11 @@ def get_user_service(
 ) -> UserService:
     user_repo = UserRepository(db)
     return UserService(user_repo, redis_client=redis)
+
+
+def get_import_service(db: AsyncSession = Depends(get_db)) -> ImportService:
+    return ImportService(ImportRepository(db))
+
+
+def get_dead_letter_queue(redis=Depends(lambda: redis_client)) -> DeadLetterQueue:
+    return DeadLetterQueue(redis)
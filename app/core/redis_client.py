@@ -4,7 +4,7 @@ from redis.asyncio import Redis
 
 
 class RedisClient:
-    def __init__(self):
+    def __init__(self, decode_responses: bool = True):
         # Load Redis configuration from environment variables
         self.redis_host = os.getenv("REDIS_HOST", "localhost")
         self.redis_port = int(os.getenv("REDIS_PORT", "6379"))
@@ -17,7 +17,7 @@ class RedisClient:
             port=self.redis_port,
             db=self.redis_db,
             password=self.redis_password,
-            decode_responses=True,
+            decode_responses=decode_responses,
         )
 
     def get_client(self):
@@ -26,3 +26,6 @@ class RedisClient:
 
 # Singleton instance for Redis client
 redis_client = RedisClient().get_client()
+
+# Consumers read raw bytes, since binary-encoded events are not valid UTF-8
+binary_redis_client = RedisClient(decode_responses=False).get_client()
@@ -12,7 +12,8 @@ DATABASE_URL = os.getenv(
 )
 
 # Setup async engine and sessionmaker
-engine = create_async_engine(DATABASE_URL, echo=False)
+# Pre-ping so long-running workers recover from connections dropped by the server
+engine = create_async_engine(DATABASE_URL, echo=False, pool_pre_ping=True)
 AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
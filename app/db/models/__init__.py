@@ -1,3 +1,3 @@
-from app.db.models.base import Base
+from app.db.models.base import Base, utcnow
 
-__all__ = ["Base"]
+__all__ = ["Base", "utcnow"]
@@ -1,3 +1,10 @@
+from datetime import datetime, timezone
+
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
+
+
+def utcnow() -> datetime:
+    # Set client-side so the value is readable without a refresh after flush
+    return datetime.now(timezone.utc)
@@ -11,7 +11,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import relationship
 import sqlalchemy.sql.functions as func
 
-from . import Base
+from . import Base, utcnow
 from .relationships import meeting_tasks, meeting_users
 
 
@@ -21,6 +21,7 @@ class Meeting(Base):
         Index("ix_recurrence_id", "recurrence_id"),
         Index("ix_meeting_start_date", "start_date"),
         Index("ix_meeting_completed", "completed"),
+        Index("ix_meeting_updated_at", "updated_at"),
     )
 
     id = Column(Integer, primary_key=True)
@@ -34,6 +35,12 @@ class Meeting(Base):
     reminder_sent = Column(Boolean, default=False)
     completed = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+    )
 
     # Relationships
     recurrence = relationship("Recurrence", back_populates="meetings", lazy="joined")
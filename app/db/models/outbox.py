@@ -0,0 +1,31 @@
+from sqlalchemy import Column, DateTime, Index, Integer, LargeBinary, String, text
+import sqlalchemy.sql.functions as func
+
+from . import Base
+
+
+class OutboxEvent(Base):
+    """
+    Event written in the same transaction as the change it describes and
+    published to Redis afterwards by the outbox relay.
+    """
+
+    __tablename__ = "outbox"
+    __table_args__ = (
+        Index(
+            "ix_outbox_unsent",
+            "id",
+            postgresql_where=text("sent_at IS NULL"),
+            sqlite_where=text("sent_at IS NULL"),
+        ),
+        Index("ix_outbox_sent_at", "sent_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    channel = Column(String(100), nullable=False)
+    message = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<OutboxEvent(id={self.id}, channel={self.channel})>"
@@ -2,7 +2,7 @@ from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String
 from sqlalchemy.orm import relationship
 import sqlalchemy.sql.functions as func
 
-from . import Base
+from . import Base, utcnow
 from .relationships import meeting_tasks
 
 
@@ -12,6 +12,7 @@ class Task(Base):
         Index("ix_task_assignee_id", "assignee_id"),
         Index("ix_task_due_date", "due_date"),
         Index("ix_task_completed", "completed"),
+        Index("ix_task_updated_at", "updated_at"),
     )
 
     id = Column(Integer, primary_key=True)
@@ -22,6 +23,12 @@ class Task(Base):
     completed = Column(Boolean, default=False)
     completed_date = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+    )
 
     # Relationships
     meetings = relationship("Meeting", secondary=meeting_tasks, back_populates="tasks")
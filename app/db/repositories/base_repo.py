@@ -1,10 +1,11 @@
-from typing import Any, Generic, Type, TypeVar, Union
+from typing import Any, AsyncIterator, Generic, Type, TypeVar, Union
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.core.logging_config import logger
+from app.db.models.outbox import OutboxEvent
 
 ModelType = TypeVar("ModelType")
 
@@ -31,6 +32,14 @@ class BaseRepository(Generic[ModelType]):
             logger.exception(f"Error creating {self.model.__name__}: {e}")
             raise
 
+    def stage_event(self, channel: str, message: bytes):
+        """
+        Add an event to the outbox without committing, so it is written
+        atomically with whatever the session commits next.
+        """
+        logger.debug(f"Staging outbox event for channel {channel}")
+        self.db.add(OutboxEvent(channel=channel, message=message))
+
     async def get_by_id(self, object_id: Union[int, UUID]) -> ModelType:
         logger.debug(f"Fetching {self.model.__name__} with ID: {object_id}")
 
@@ -70,6 +79,32 @@ class BaseRepository(Generic[ModelType]):
             logger.exception(f"Error fetching all {self.model.__name__}: {e}")
             raise
 
+    async def stream_all(
+        self, criteria: list = None, yield_per: int = 1000
+    ) -> AsyncIterator[ModelType]:
+        """
+        Stream every matching row through a server-side cursor, ordered by ID.
+        :param criteria: Optional list of SQL expressions to filter on.
+        :param yield_per: Number of rows fetched from the cursor at a time.
+        :return: Async iterator of model objects.
+        """
+        logger.debug(
+            f"Streaming {self.model.__name__} with criteria={criteria}, "
+            f"yield_per={yield_per}"
+        )
+        stmt = (
+            select(self.model)
+            .where(*(criteria or []))
+            .order_by(self.model.id)
+            .execution_options(yield_per=yield_per)
+        )
+        result = await self.db.stream_scalars(stmt)
+        count = 0
+        async for entity in result:
+            count += 1
+            yield entity
+        logger.debug(f"Streamed {count} {self.model.__name__}(s)")
+
     async def get_by_field(self, field_name: str, value: Any) -> list[ModelType]:
         logger.debug(f"Fetching {self.model.__name__} by {field_name}={value}")
         stmt = select(self.model).filter(getattr(self.model, field_name) == value)
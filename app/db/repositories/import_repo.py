@@ -0,0 +1,100 @@
+from typing import AsyncIterator
+
+from sqlalchemy import Column, MetaData, Table, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging_config import logger
+
+
+class ImportRepository:
+    """
+    Bulk loader that bypasses the ORM unit of work.
+
+    On Postgres rows are streamed into a temporary staging table with COPY and
+    merged into the target in a single INSERT ... SELECT. SQLite falls back to
+    chunked executemany inserts. Rows that collide with an existing
+    primary key are skipped in both cases.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def load_rows(
+        self,
+        table: Table,
+        columns: list[str],
+        chunks: AsyncIterator[list[dict]],
+    ) -> int:
+        """
+        Load rows into a table inside a single transaction.
+        :param table: Target table.
+        :param columns: Column names present in every row.
+        :param chunks: Async iterator of row batches.
+        :return: Number of rows inserted.
+        """
+        dialect = self.db.get_bind().dialect.name
+        logger.info(f"Bulk loading {table.name} using the {dialect} loader")
+        try:
+            if dialect == "postgresql":
+                inserted = await self._copy_and_merge(table, columns, chunks)
+            else:
+                inserted = await self._insert_chunks(table, chunks)
+            await self.db.commit()
+        except Exception as e:
+            logger.exception(f"Error bulk loading {table.name}: {e}")
+            await self.db.rollback()
+            raise
+        logger.info(f"Bulk loaded {inserted} rows into {table.name}")
+        return inserted
+
+    async def _copy_and_merge(
+        self, table: Table, columns: list[str], chunks: AsyncIterator[list[dict]]
+    ) -> int:
+        staging = Table(
+            f"import_{table.name}",
+            MetaData(),
+            *(Column(column, table.c[column].type) for column in columns),
+        )
+
+        conn = await self.db.connection()
+        raw_conn = await conn.get_raw_connection()
+        driver_conn = raw_conn.driver_connection
+
+        await driver_conn.execute(
+            f"CREATE TEMP TABLE {staging.name} "
+            f"(LIKE {table.name} INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        async for rows in chunks:
+            await driver_conn.copy_records_to_table(
+                staging.name,
+                records=[tuple(row[column] for column in columns) for row in rows],
+                columns=columns,
+            )
+
+        # Insert the staged rows that don't collide with existing ones
+        merge = pg_insert(table).from_select(
+            columns, select(*(staging.c[column] for column in columns))
+        )
+        result = await self.db.execute(merge.on_conflict_do_nothing())
+
+        if "id" in columns:
+            # Explicit IDs bypass the serial sequence, so move it past them
+            await self.db.execute(
+                text(
+                    f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                    f"(SELECT COALESCE(MAX(id), 1) FROM {table.name}))"
+                )
+            )
+        return result.rowcount
+
+    async def _insert_chunks(
+        self, table: Table, chunks: AsyncIterator[list[dict]]
+    ) -> int:
+        stmt = sqlite_insert(table).on_conflict_do_nothing()
+        inserted = 0
+        async for rows in chunks:
+            result = await self.db.execute(stmt, rows)
+            inserted += result.rowcount
+        return inserted
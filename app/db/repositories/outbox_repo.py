@@ -0,0 +1,64 @@
+from datetime import datetime
+
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.core.logging_config import logger
+from app.db.models import utcnow
+from app.db.models.outbox import OutboxEvent
+from app.db.repositories import BaseRepository
+
+
+class OutboxRepository(BaseRepository[OutboxEvent]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(OutboxEvent, db)
+
+    async def claim_pending(self, limit: int) -> list[OutboxEvent]:
+        """
+        Lock the oldest unsent events. Rows locked by another relay are skipped,
+        so several relays can drain the outbox without publishing twice.
+        :param limit: Maximum number of events to claim.
+        :return: List of OutboxEvent objects, oldest first.
+        """
+        stmt = (
+            select(self.model)
+            .where(self.model.sent_at.is_(None))
+            .order_by(self.model.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.db.execute(stmt)
+        events = result.scalars().all()
+        logger.debug(f"Claimed {len(events)} outbox events")
+        return events
+
+    async def mark_sent(self, event_ids: list[int]):
+        """
+        Mark events as published and release their locks.
+        :param event_ids: IDs of the published events.
+        """
+        stmt = (
+            update(self.model)
+            .where(self.model.id.in_(event_ids))
+            .values(sent_at=utcnow())
+        )
+        try:
+            await self.db.execute(stmt)
+            await self.db.commit()
+        except Exception as e:
+            logger.exception(f"Error marking outbox events as sent: {e}")
+            await self.db.rollback()
+            raise
+
+    async def purge_sent(self, before: datetime) -> int:
+        """
+        Delete events published before a cutoff.
+        :param before: Events sent before this time are deleted.
+        :return: Number of deleted events.
+        """
+        stmt = delete(self.model).where(self.model.sent_at < before)
+        result = await self.db.execute(stmt)
+        await self.db.commit()
+        logger.debug(f"Purged {result.rowcount} sent outbox events")
+        return result.rowcount
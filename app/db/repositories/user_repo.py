@@ -1,3 +1,8 @@
+from uuid import UUID
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -40,3 +45,45 @@ class UserRepository(BaseRepository[User]):
                 f"No user found for meeting ID {meeting_id} and user ID {user_id}"
             )
         return user
+
+    async def apply_batch(self, upserts: list[dict], deletes: list[UUID]):
+        """
+        Apply a batch of user changes in one transaction.
+        Deletes run first, so a user deleted and re-created in the same batch
+        ends up with only the re-created fields.
+        :param upserts: Rows keyed by column name; each must include `id`.
+        :param deletes: IDs of users to delete.
+        """
+        logger.debug(f"Applying {len(upserts)} upserts and {len(deletes)} deletes")
+        dialect = self.db.get_bind().dialect.name
+        insert = pg_insert if dialect == "postgresql" else sqlite_insert
+
+        # Rows can only share a VALUES list when they set the same columns
+        groups: dict[tuple, list[dict]] = {}
+        for row in upserts:
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+
+        try:
+            if deletes:
+                await self.db.execute(
+                    delete(self.model).where(self.model.id.in_(deletes))
+                )
+            for columns, rows in groups.items():
+                stmt = insert(self.model).values(rows)
+                updates = {
+                    column: stmt.excluded[column]
+                    for column in columns
+                    if column != "id"
+                }
+                if updates:
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=[self.model.id], set_=updates
+                    )
+                else:
+                    stmt = stmt.on_conflict_do_nothing(index_elements=[self.model.id])
+                await self.db.execute(stmt)
+            await self.db.commit()
+        except Exception as e:
+            logger.exception(f"Error applying user batch: {e}")
+            await self.db.rollback()
+            raise
@@ -0,0 +1,93 @@
+"""
+Event bus used by services to publish domain events and by the subscriber to
+consume them. `EVENT_BUS` picks the implementation: "redis" for deployments
+with more than one process, "memory" for a single process that should not
+depend on Redis at all.
+"""
+
+import asyncio
+from typing import Optional
+
+from app.core.config import settings
+from app.core.logging_config import logger
+from app.events.envelope import EventEnvelope, encode_event
+from app.events.publisher import get_event_publisher
+from app.events.transport import DeliverCallback, Delivery, get_event_transport
+
+
+class RedisEventBus:
+    """
+    Events are encoded and go through Redis, either staged in the outbox or
+    handed to the in-process publisher, and are consumed through the
+    configured transport.
+    """
+
+    is_local = False
+
+    def __init__(self, redis_client, transport=None):
+        self.redis_client = redis_client
+        self.transport = transport or get_event_transport(redis_client)
+
+    @property
+    def uses_outbox(self) -> bool:
+        return settings.EVENT_OUTBOX_ENABLED
+
+    async def publish(self, channel: str, event: EventEnvelope):
+        await get_event_publisher(self.redis_client).publish(
+            channel, encode_event(event)
+        )
+
+    async def consume(self, channels: list[str], deliver: DeliverCallback):
+        await self.transport.consume(channels, deliver)
+
+
+class InMemoryEventBus:
+    """
+    Deliver events to consumers in this process, as the envelope objects
+    themselves: no encoding, no network hop. Like pub/sub, each consumer gets
+    every event published after it subscribed, and nothing survives a
+    restart. `join` waits until every published event has been delivered.
+    """
+
+    is_local = True
+    uses_outbox = False
+
+    def __init__(self, max_size: int = settings.EVENT_PUBLISH_QUEUE_SIZE):
+        self.max_size = max_size
+        self.queues: dict[str, list[asyncio.Queue]] = {}
+
+    async def publish(self, channel: str, event: EventEnvelope):
+        for queue in self.queues.get(channel, []):
+            await queue.put(Delivery(channel, event))
+
+    async def consume(self, channels: list[str], deliver: DeliverCallback):
+        queue: asyncio.Queue[Delivery] = asyncio.Queue(self.max_size)
+        for channel in channels:
+            self.queues.setdefault(channel, []).append(queue)
+        logger.info(f"Subscribed to {channels} in process")
+        try:
+            while True:
+                delivery = await queue.get()
+                try:
+                    await deliver(delivery)
+                finally:
+                    queue.task_done()
+        finally:
+            for channel in channels:
+                self.queues[channel].remove(queue)
+
+    async def join(self):
+        queues = {id(queue): queue for qs in self.queues.values() for queue in qs}
+        await asyncio.gather(*(queue.join() for queue in queues.values()))
+
+
+_memory_bus: Optional[InMemoryEventBus] = None
+
+
+def get_event_bus(redis_client, transport=None):
+    if settings.EVENT_BUS == "memory":
+        global _memory_bus  # pylint: disable=global-statement
+        if _memory_bus is None:
+            _memory_bus = InMemoryEventBus()
+        return _memory_bus
+    return RedisEventBus(redis_client, transport)
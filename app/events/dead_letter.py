@@ -0,0 +1,106 @@
+import base64
+from datetime import datetime
+import json
+from typing import Union
+
+from app.core.config import settings
+from app.core.logging_config import logger
+from app.core.metrics import Counter
+from app.db.models import utcnow
+from app.events.transport import get_event_transport
+
+dead_letters_total = Counter(
+    "event_dead_letters_total",
+    "Events moved to the dead-letter list",
+    labels=("channel",),
+)
+
+
+class DeadLetterQueue:
+    """
+    Redis list of events that could not be handled, newest first.
+
+    Each entry keeps the original channel and message along with the error, so
+    an event can be inspected and later replayed onto its channel unchanged.
+    Binary messages are stored base64-encoded. The list is capped at `max_len`
+    entries; the oldest are dropped first.
+    """
+
+    def __init__(
+        self,
+        redis_client,
+        key: str = settings.DEAD_LETTER_KEY,
+        max_len: int = settings.DEAD_LETTER_MAX_LEN,
+        transport=None,
+    ):
+        self.redis_client = redis_client
+        self.key = key
+        self.max_len = max_len
+        self.transport = transport or get_event_transport(redis_client)
+
+    async def push(
+        self, channel: str, data: Union[str, bytes], error: str, attempts: int = 1
+    ):
+        entry = {
+            "channel": channel,
+            "error": error,
+            "attempts": attempts,
+            "failed_at": utcnow().isoformat(),
+        }
+        if isinstance(data, bytes):
+            entry["data_b64"] = base64.b64encode(data).decode()
+        else:
+            entry["data"] = data
+
+        pipe = self.redis_client.pipeline(transaction=True)
+        pipe.lpush(self.key, json.dumps(entry))
+        pipe.ltrim(self.key, 0, self.max_len - 1)
+        await pipe.execute()
+        dead_letters_total.inc(channel=channel)
+        logger.warning(f"Dead-lettered event from {channel}: {error}")
+
+    async def size(self) -> int:
+        return await self.redis_client.llen(self.key)
+
+    async def peek(self, limit: int = 100) -> list[dict]:
+        """Return up to `limit` entries, oldest first, without removing them."""
+        raw = await self.redis_client.lrange(self.key, -limit, -1)
+        return [self._load(entry) for entry in reversed(raw)]
+
+    async def replay(self, limit: int = 1000) -> int:
+        """
+        Move up to `limit` of the oldest entries back onto their channels.
+        Entries are popped before publishing, so a failed publish puts the
+        batch back at the old end of the list.
+        """
+        raw = await self.redis_client.rpop(self.key, limit)
+        if not raw:
+            return 0
+
+        entries = [self._load(entry) for entry in raw]
+        try:
+            await self.transport.publish_many(
+                [(entry["channel"], self._message(entry)) for entry in entries]
+            )
+        except Exception:
+            await self.redis_client.rpush(self.key, *reversed(raw))
+            raise
+        logger.info(f"Replayed {len(entries)} dead-lettered events")
+        return len(entries)
+
+    async def purge(self) -> int:
+        size = await self.size()
+        await self.redis_client.delete(self.key)
+        return size
+
+    @staticmethod
+    def _load(raw: Union[str, bytes]) -> dict:
+        entry = json.loads(raw)
+        entry["failed_at"] = datetime.fromisoformat(entry["failed_at"])
+        return entry
+
+    @staticmethod
+    def _message(entry: dict) -> Union[str, bytes]:
+        if "data_b64" in entry:
+            return base64.b64decode(entry["data_b64"])
+        return entry["data"]
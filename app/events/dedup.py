@@ -0,0 +1,84 @@
+from collections import OrderedDict
+from typing import Optional
+
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.logging_config import logger
+from app.core.metrics import Counter
+
+dedup_checks_total = Counter(
+    "event_dedup_checks_total", "Event ids checked for duplicate delivery"
+)
+dedup_hits_total = Counter(
+    "event_dedup_hits_total",
+    "Duplicate events skipped, by the layer that caught them",
+    labels=("layer",),
+)
+
+
+class EventDeduplicator:
+    """
+    Skip events that have already been handled.
+
+    An event id is claimed with SET NX plus a TTL before any database work, so
+    across all replicas only the first delivery of an event is handled. Ids
+    claimed by this process are also kept in a bounded local LRU, which
+    answers redeliveries to the same replica without a round trip. The LRU is
+    exact rather than a Bloom filter: a false positive would silently drop a
+    real event. A failed event is released so a retry or replay can claim it
+    again. Events without an id, from producers that predate it, are never
+    treated as duplicates, and a Redis error lets the event through.
+    """
+
+    def __init__(
+        self,
+        redis_client,
+        namespace: str = settings.EVENT_CONSUMER_GROUP,
+        ttl_seconds: int = settings.EVENT_DEDUP_TTL_SECONDS,
+        local_size: int = settings.EVENT_DEDUP_LOCAL_SIZE,
+    ):
+        self.redis_client = redis_client
+        self.prefix = f"events:seen:{namespace}:"
+        self.ttl_seconds = ttl_seconds
+        self.local_size = local_size
+        self.local: OrderedDict[str, None] = OrderedDict()
+
+    async def claim(self, event_id: Optional[str]) -> bool:
+        """Return True if this delivery should be handled, False if a duplicate."""
+        if not event_id:
+            return True
+        dedup_checks_total.inc()
+
+        if event_id in self.local:
+            self.local.move_to_end(event_id)
+            dedup_hits_total.inc(layer="local")
+            return False
+
+        try:
+            claimed = await self.redis_client.set(
+                self.prefix + event_id, 1, nx=True, ex=self.ttl_seconds
+            )
+        except RedisError as exc:
+            logger.warning(f"Dedup check failed, handling event {event_id}: {exc}")
+            return True
+
+        self._remember(event_id)
+        if not claimed:
+            dedup_hits_total.inc(layer="redis")
+            return False
+        return True
+
+    async def release(self, event_id: Optional[str]):
+        if not event_id:
+            return
+        self.local.pop(event_id, None)
+        try:
+            await self.redis_client.delete(self.prefix + event_id)
+        except RedisError as exc:
+            logger.warning(f"Could not release dedup claim on {event_id}: {exc}")
+
+    def _remember(self, event_id: str):
+        self.local[event_id] = None
+        if len(self.local) > self.local_size:
+            self.local.popitem(last=False)
@@ -0,0 +1,123 @@
+"""
+Versioned event envelope and the codecs used to put it on the wire.
+
+Every event is one map with the keys `id`, `event_type`, `model`, `version`,
+`ts` and `payload`. The id is unique per event and lets consumers drop
+redeliveries. Producers pick a codec with `EVENT_CODEC`; consumers detect it
+from the first byte, so JSON and msgpack producers can share a channel while
+they are migrated. JSON stays the default because other services read these
+channels; msgpack is used only when the optional `msgpack` package is
+installed.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from enum import Enum
+import json
+import time
+from typing import Any, Optional, Union
+import uuid
+
+from app.core.config import settings
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+ENVELOPE_VERSION = 1
+
+
+@dataclass
+class EventEnvelope:
+    event_type: str
+    model: str
+    payload: dict = field(default_factory=dict)
+    version: int = ENVELOPE_VERSION
+    ts: float = field(default_factory=time.time)
+    id: Optional[str] = field(default_factory=lambda: uuid.uuid4().hex)
+
+    def to_wire(self) -> dict:
+        return {
+            "id": self.id,
+            "event_type": self.event_type,
+            "model": self.model,
+            "version": self.version,
+            "ts": self.ts,
+            "payload": self.payload,
+        }
+
+    @classmethod
+    def from_wire(cls, data: dict) -> "EventEnvelope":
+        if not isinstance(data, dict) or "event_type" not in data:
+            raise ValueError("Event is missing 'event_type'")
+        return cls(
+            event_type=data["event_type"],
+            model=data.get("model", ""),
+            payload=data.get("payload") or {},
+            # Events from before the envelope carry no version or timestamp
+            version=data.get("version", 0),
+            ts=data.get("ts", 0.0),
+            id=data.get("id"),
+        )
+
+
+def _default(value: Any):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+class JsonCodec:
+    name = "json"
+
+    def encode(self, envelope: EventEnvelope) -> bytes:
+        return json.dumps(
+            envelope.to_wire(), default=_default, separators=(",", ":")
+        ).encode()
+
+    def decode(self, data: Union[str, bytes]) -> EventEnvelope:
+        return EventEnvelope.from_wire(json.loads(data))
+
+
+class MsgpackCodec:
+    name = "msgpack"
+
+    def __init__(self):
+        if msgpack is None:
+            raise RuntimeError("EVENT_CODEC=msgpack needs the msgpack package")
+
+    def encode(self, envelope: EventEnvelope) -> bytes:
+        return msgpack.packb(envelope.to_wire(), default=_default, use_bin_type=True)
+
+    def decode(self, data: bytes) -> EventEnvelope:
+        return EventEnvelope.from_wire(msgpack.unpackb(data, raw=False))
+
+
+CODECS = {"json": JsonCodec, "msgpack": MsgpackCodec}
+_codecs: dict = {}
+
+
+def get_event_codec(name: Optional[str] = None):
+    name = name or settings.EVENT_CODEC
+    if name not in CODECS:
+        raise ValueError(f"Unknown event codec {name!r}")
+    if name not in _codecs:
+        _codecs[name] = CODECS[name]()
+    return _codecs[name]
+
+
+def encode_event(envelope: EventEnvelope) -> bytes:
+    return get_event_codec().encode(envelope)
+
+
+def decode_event(data: Union[str, bytes]) -> EventEnvelope:
+    """
+    Decode an event in any supported format. JSON always starts with "{",
+    which is never the first byte of a msgpack map.
+    """
+    if isinstance(data, str) or data.lstrip()[:1] == b"{":
+        return get_event_codec("json").decode(data)
+    return get_event_codec("msgpack").decode(data)
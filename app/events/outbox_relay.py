@@ -0,0 +1,78 @@
+import asyncio
+from datetime import timedelta
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.logging_config import logger
+from app.db.models import utcnow
+from app.db.repositories.outbox_repo import OutboxRepository
+from app.events.transport import get_event_transport
+
+
+class OutboxRelay:
+    """
+    Publish events from the outbox table.
+
+    Each cycle claims a batch of unsent rows, publishes them in one pipelined
+    round trip and marks them sent in the same transaction that holds their
+    locks. A failure before the commit leaves the rows pending for the next
+    cycle, so delivery is at-least-once. Sent rows are purged once they are
+    older than the retention window.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker[AsyncSession],
+        redis_client,
+        batch_size: int = settings.OUTBOX_BATCH_SIZE,
+        poll_interval_ms: int = settings.OUTBOX_POLL_INTERVAL_MS,
+        retention_hours: int = settings.OUTBOX_RETENTION_HOURS,
+        transport=None,
+    ):
+        self.session_factory = session_factory
+        self.transport = transport or get_event_transport(redis_client)
+        self.batch_size = batch_size
+        self.poll_interval_ms = poll_interval_ms
+        self.retention = timedelta(hours=retention_hours)
+        self.next_purge = 0.0
+
+    async def run(self):
+        logger.info("Outbox relay started")
+        while True:
+            try:
+                sent = await self.relay_once()
+                if sent < self.batch_size:
+                    await self._purge_if_due()
+                    await asyncio.sleep(self.poll_interval_ms / 1000)
+            except asyncio.CancelledError:
+                logger.info("Outbox relay stopped")
+                raise
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logger.exception(f"Outbox relay cycle failed: {exc}")
+                await asyncio.sleep(self.poll_interval_ms / 1000)
+
+    async def relay_once(self) -> int:
+        async with self.session_factory() as session:
+            repo = OutboxRepository(session)
+            events = await repo.claim_pending(self.batch_size)
+            if not events:
+                await session.rollback()
+                return 0
+
+            await self.transport.publish_many(
+                [(event.channel, event.message) for event in events]
+            )
+            await repo.mark_sent([event.id for event in events])
+
+        logger.debug(f"Relayed {len(events)} outbox events")
+        return len(events)
+
+    async def _purge_if_due(self):
+        if time.monotonic() < self.next_purge:
+            return
+        self.next_purge = time.monotonic() + 60
+        async with self.session_factory() as session:
+            await OutboxRepository(session).purge_sent(utcnow() - self.retention)
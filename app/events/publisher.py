@@ -0,0 +1,174 @@
+import asyncio
+import base64
+import json
+import os
+import time
+from typing import Optional, Union
+
+from app.core.config import settings
+from app.core.logging_config import logger
+from app.core.metrics import Counter, Gauge, Histogram
+from app.events.transport import get_event_transport
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "spill")
+
+queue_depth_gauge = Gauge(
+    "event_publisher_queue_depth", "Events waiting in the in-process publish queue"
+)
+flush_seconds = Histogram(
+    "event_publisher_flush_seconds", "Time taken to publish one pipelined batch"
+)
+published_total = Counter(
+    "event_publisher_published_total", "Events published by the in-process publisher"
+)
+overflow_total = Counter(
+    "event_publisher_overflow_total",
+    "Events dropped or spilled to disk because the publish queue was full",
+    labels=("policy",),
+)
+
+Message = tuple[str, Union[str, bytes]]
+
+
+class EventPublisher:
+    """
+    Publish events from a bounded in-process queue.
+
+    `publish` only enqueues; a background task started on first use drains the
+    queue into pipelined batches of up to `batch_size` messages. When the queue
+    is full, `overflow` decides what happens: "block" waits for room,
+    "drop_oldest" discards the oldest queued event and "spill" appends the
+    event to `spill_path`, which is replayed once the queue has drained. A
+    failed batch is retried until Redis is back, so the overflow policy is
+    what bounds memory during an outage.
+    """
+
+    def __init__(
+        self,
+        redis_client,
+        max_size: int = settings.EVENT_PUBLISH_QUEUE_SIZE,
+        batch_size: int = settings.EVENT_PUBLISH_BATCH_SIZE,
+        overflow: str = settings.EVENT_PUBLISH_OVERFLOW,
+        spill_path: str = settings.EVENT_PUBLISH_SPILL_PATH,
+        retry_delay_ms: int = 500,
+        transport=None,
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow!r}")
+        self.transport = transport or get_event_transport(redis_client)
+        self.queue: asyncio.Queue[Message] = asyncio.Queue(max_size)
+        self.batch_size = batch_size
+        self.overflow = overflow
+        self.spill_path = spill_path
+        self.retry_delay_ms = retry_delay_ms
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def depth(self) -> int:
+        return self.queue.qsize()
+
+    async def publish(self, channel: str, message: Union[str, bytes]):
+        self._ensure_started()
+        if not self.queue.full() or self.overflow == "block":
+            await self.queue.put((channel, message))
+        elif self.overflow == "drop_oldest":
+            dropped = self.queue.get_nowait()
+            self.queue.task_done()
+            self.queue.put_nowait((channel, message))
+            overflow_total.inc(policy=self.overflow)
+            logger.warning(f"Publish queue full, dropped event for {dropped[0]}")
+        else:
+            self._spill([(channel, message)])
+            overflow_total.inc(policy=self.overflow)
+        queue_depth_gauge.set(self.depth)
+
+    async def flush(self):
+        """Wait until every queued event has been published."""
+        if self.task is not None:
+            await self.queue.join()
+
+    async def close(self):
+        """Publish what is queued, then stop the background task."""
+        await self.flush()
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    def _ensure_started(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            queue_depth_gauge.set(self.depth)
+
+            await self._publish_batch(batch)
+            for _ in batch:
+                self.queue.task_done()
+
+            if self.queue.empty() and os.path.exists(self.spill_path):
+                await self._replay_spill()
+
+    async def _publish_batch(self, batch: list[Message]):
+        while True:
+            started = time.perf_counter()
+            try:
+                await self.transport.publish_many(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logger.error(f"Publishing {len(batch)} events failed: {exc}")
+                await asyncio.sleep(self.retry_delay_ms / 1000)
+                continue
+            flush_seconds.observe(time.perf_counter() - started)
+            published_total.inc(len(batch))
+            return
+
+    def _spill(self, messages: list[Message]):
+        os.makedirs(os.path.dirname(self.spill_path) or ".", exist_ok=True)
+        with open(self.spill_path, "a", encoding="utf-8") as spill:
+            for channel, message in messages:
+                if isinstance(message, bytes):
+                    record = [channel, base64.b64encode(message).decode(), "b64"]
+                else:
+                    record = [channel, message]
+                spill.write(json.dumps(record) + "\n")
+
+    async def _replay_spill(self):
+        # Rename first so events spilled while replaying go to a fresh file
+        replay_path = f"{self.spill_path}.replay"
+        os.replace(self.spill_path, replay_path)
+        with open(replay_path, encoding="utf-8") as spill:
+            records = [json.loads(line) for line in spill if line.strip()]
+        messages = [
+            (record[0], base64.b64decode(record[1]) if len(record) > 2 else record[1])
+            for record in records
+        ]
+        logger.info(f"Replaying {len(messages)} spilled events")
+        for start in range(0, len(messages), self.batch_size):
+            await self._publish_batch(messages[start : start + self.batch_size])
+        os.remove(replay_path)
+
+
+_publishers: dict = {}
+
+
+def get_event_publisher(redis_client) -> EventPublisher:
+    """Return the shared publisher for a Redis client, creating it on first use."""
+    publisher = _publishers.get(redis_client)
+    if publisher is None:
+        publisher = _publishers[redis_client] = EventPublisher(redis_client)
+    return publisher
+
+
+async def close_event_publishers():
+    while _publishers:
+        _, publisher = _publishers.popitem()
+        await publisher.close()
@@ -0,0 +1,161 @@
+from dataclasses import dataclass
+import os
+import socket
+import time
+from typing import Awaitable, Callable, Optional, Union
+
+from redis.exceptions import ResponseError
+
+from app.core.config import settings
+from app.core.logging_config import logger
+
+
+@dataclass
+class Delivery:
+    """A raw message received from a transport, acked once it has been handled"""
+
+    channel: str
+    data: Union[str, bytes]
+    ack: Optional[Callable[[], Awaitable[None]]] = None
+
+
+DeliverCallback = Callable[[Delivery], Awaitable[None]]
+
+
+def _as_str(value: Union[str, bytes]) -> str:
+    # Clients created with decode_responses=False return channel names as bytes
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class PubSubTransport:
+    """Fire-and-forget Redis pub/sub: every subscriber gets every message"""
+
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+
+    async def publish(self, channel: str, message: Union[str, bytes]):
+        await self.redis_client.publish(channel, message)
+
+    async def publish_many(self, messages: list[tuple[str, Union[str, bytes]]]):
+        """Publish several messages in one pipelined round trip"""
+        pipe = self.redis_client.pipeline(transaction=False)
+        for channel, message in messages:
+            pipe.publish(channel, message)
+        await pipe.execute()
+
+    async def consume(self, channels: list[str], deliver: DeliverCallback):
+        pubsub = self.redis_client.pubsub()
+        await pubsub.subscribe(*channels)
+        logger.info(f"Subscribed to {channels} channel.")
+
+        async for message in pubsub.listen():
+            if message["type"] == "message":
+                channel = _as_str(message["channel"])
+                await deliver(Delivery(channel, message["data"]))
+
+
+class StreamsTransport:
+    """
+    Durable transport on Redis Streams.
+
+    Each channel is a stream written with XADD. Consumers read through a
+    consumer group, so every event is handled by one replica of this service
+    and stays pending until it is XACKed. Entries left pending by a crashed or
+    stalled consumer are taken over with XAUTOCLAIM once they have been idle
+    for `claim_idle_ms`. Producers of a channel must use the same transport.
+    """
+
+    def __init__(
+        self,
+        redis_client,
+        group: str = settings.EVENT_CONSUMER_GROUP,
+        consumer: Optional[str] = None,
+        maxlen: int = settings.EVENT_STREAM_MAXLEN,
+        batch_size: int = settings.EVENT_STREAM_BATCH_SIZE,
+        block_ms: int = settings.EVENT_STREAM_BLOCK_MS,
+        claim_idle_ms: int = settings.EVENT_STREAM_CLAIM_IDLE_MS,
+    ):
+        self.redis_client = redis_client
+        self.group = group
+        self.consumer = consumer or f"{socket.gethostname()}-{os.getpid()}"
+        self.maxlen = maxlen
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.claim_idle_ms = claim_idle_ms
+
+    async def publish(self, channel: str, message: Union[str, bytes]):
+        await self.redis_client.xadd(
+            channel, {"data": message}, maxlen=self.maxlen, approximate=True
+        )
+
+    async def publish_many(self, messages: list[tuple[str, Union[str, bytes]]]):
+        """Append several messages in one pipelined round trip"""
+        pipe = self.redis_client.pipeline(transaction=False)
+        for channel, message in messages:
+            pipe.xadd(channel, {"data": message}, maxlen=self.maxlen, approximate=True)
+        await pipe.execute()
+
+    async def consume(self, channels: list[str], deliver: DeliverCallback):
+        for channel in channels:
+            await self._ensure_group(channel)
+        logger.info(f"Consuming {channels} as {self.consumer} in group {self.group}")
+
+        claim_cursors = {channel: "0-0" for channel in channels}
+        next_claim = 0.0
+        while True:
+            if time.monotonic() >= next_claim:
+                for channel in channels:
+                    claim_cursors[channel] = await self._reclaim(
+                        channel, claim_cursors[channel], deliver
+                    )
+                next_claim = time.monotonic() + self.claim_idle_ms / 1000
+
+            response = await self.redis_client.xreadgroup(
+                self.group,
+                self.consumer,
+                streams={channel: ">" for channel in channels},
+                count=self.batch_size,
+                block=self.block_ms,
+            )
+            for channel, entries in response or []:
+                channel = _as_str(channel)
+                for entry_id, fields in entries:
+                    await deliver(self._delivery(channel, entry_id, fields))
+
+    async def _ensure_group(self, channel: str):
+        try:
+            await self.redis_client.xgroup_create(
+                channel, self.group, id="$", mkstream=True
+            )
+            logger.info(f"Created consumer group {self.group} on {channel}")
+        except ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+    async def _reclaim(self, channel: str, cursor: str, deliver: DeliverCallback):
+        response = await self.redis_client.xautoclaim(
+            channel,
+            self.group,
+            self.consumer,
+            min_idle_time=self.claim_idle_ms,
+            start_id=cursor,
+            count=self.batch_size,
+        )
+        next_cursor, entries = response[0], response[1]
+        if entries:
+            logger.warning(f"Reclaimed {len(entries)} stuck entries from {channel}")
+        for entry_id, fields in entries:
+            await deliver(self._delivery(channel, entry_id, fields))
+        return next_cursor
+
+    def _delivery(self, channel: str, entry_id: str, fields: dict) -> Delivery:
+        async def ack():
+            await self.redis_client.xack(channel, self.group, entry_id)
+
+        return Delivery(channel, fields.get("data", fields.get(b"data")), ack)
+
+
+def get_event_transport(redis_client):
+    if settings.EVENT_TRANSPORT == "streams":
+        return StreamsTransport(redis_client)
+    return PubSubTransport(redis_client)
@@ -0,0 +1,170 @@
+import asyncio
+from dataclasses import dataclass, field
+import time
+from typing import Awaitable, Callable, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.logging_config import logger
+from app.core.metrics import Counter, Histogram
+from app.db.repositories.user_repo import UserRepository
+from app.events.dead_letter import DeadLetterQueue
+from app.events.envelope import EventEnvelope, encode_event
+
+batch_size_histogram = Histogram(
+    "user_batch_size",
+    "User events written per batch",
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500),
+)
+batch_flush_seconds = Histogram(
+    "user_batch_flush_seconds", "Time taken to write one batch of user events"
+)
+batch_collapsed_total = Counter(
+    "user_batch_collapsed_events_total",
+    "User events merged into a pending change for the same user",
+)
+batch_failures_total = Counter(
+    "user_batch_failures_total", "User batches that fell back to per-user writes"
+)
+
+Ack = Callable[[], Awaitable[None]]
+
+
+@dataclass
+class PendingUser:
+    fields: Optional[dict] = None
+    deleted: bool = False
+    acks: list[Ack] = field(default_factory=list)
+
+
+class UserUpsertBatcher:
+    """
+    Buffer user-events and write them in batches.
+
+    Changes are held for up to `max_batch` events or `max_delay_ms`, whichever
+    comes first. Repeated changes to one user collapse into a single row, and
+    each batch is written with one INSERT ... ON CONFLICT (id) DO UPDATE per
+    distinct column set. Acks are deferred until the batch holding the event
+    has been committed.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker[AsyncSession],
+        max_batch: int = settings.USER_BATCH_SIZE,
+        max_delay_ms: int = settings.USER_BATCH_MAX_DELAY_MS,
+        dead_letters: Optional[DeadLetterQueue] = None,
+    ):
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.max_delay_ms = max_delay_ms
+        self.dead_letters = dead_letters
+        self.pending: dict[UUID, PendingUser] = {}
+        self.buffered = 0
+        self.lock = asyncio.Lock()
+        self.timer: Optional[asyncio.Task] = None
+
+    async def upsert(self, user_id: UUID, fields: dict, ack: Optional[Ack] = None):
+        entry = self._entry(user_id, ack)
+        entry.fields = {**(entry.fields or {}), **fields, "id": user_id}
+        await self._added()
+
+    async def delete(self, user_id: UUID, ack: Optional[Ack] = None):
+        entry = self._entry(user_id, ack)
+        entry.fields = None
+        entry.deleted = True
+        await self._added()
+
+    def _entry(self, user_id: UUID, ack: Optional[Ack]) -> PendingUser:
+        entry = self.pending.get(user_id)
+        if entry is None:
+            entry = self.pending[user_id] = PendingUser()
+        else:
+            batch_collapsed_total.inc()
+        if ack:
+            entry.acks.append(ack)
+        return entry
+
+    async def _added(self):
+        self.buffered += 1
+        if self.buffered >= self.max_batch:
+            await self.flush()
+        elif self.timer is None:
+            self.timer = asyncio.create_task(self._flush_after_delay())
+
+    async def _flush_after_delay(self):
+        await asyncio.sleep(self.max_delay_ms / 1000)
+        self.timer = None
+        await self.flush()
+
+    async def flush(self):
+        if self.timer and self.timer is not asyncio.current_task():
+            self.timer.cancel()
+            self.timer = None
+
+        async with self.lock:
+            if not self.pending:
+                return
+            pending, events = self.pending, self.buffered
+            self.pending, self.buffered = {}, 0
+
+            start_time = time.perf_counter()
+            try:
+                await self._apply(pending)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logger.warning(f"User batch failed, retrying per user: {exc}")
+                batch_failures_total.inc()
+                await self._apply_individually(pending)
+                return
+            finally:
+                batch_flush_seconds.observe(time.perf_counter() - start_time)
+
+            batch_size_histogram.observe(events)
+            logger.debug(f"Flushed {events} user events as {len(pending)} changes")
+            for entry in pending.values():
+                await self._ack(entry)
+
+    async def _apply(self, pending: dict[UUID, PendingUser]):
+        upserts = [entry.fields for entry in pending.values() if entry.fields]
+        deletes = [user_id for user_id, entry in pending.items() if entry.deleted]
+        async with self.session_factory() as session:
+            await UserRepository(session).apply_batch(upserts, deletes)
+
+    async def _apply_individually(self, pending: dict[UUID, PendingUser]):
+        # Isolate the rows that broke the batch; the rest still get written
+        for user_id, entry in pending.items():
+            try:
+                await self._apply({user_id: entry})
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logger.error(f"Failed to apply user event for {user_id}: {exc}")
+                if not await self._dead_letter(user_id, entry, exc):
+                    continue
+            await self._ack(entry)
+
+    async def _dead_letter(
+        self, user_id: UUID, entry: PendingUser, exc: Exception
+    ) -> bool:
+        """
+        Quarantine the collapsed change for a user. It is stored as a single
+        event, so a replay applies the same change the batch tried to write.
+        """
+        if self.dead_letters is None:
+            return False
+        if entry.fields:
+            event = EventEnvelope("update", "User", entry.fields)
+        else:
+            event = EventEnvelope("delete", "User", {"id": user_id})
+        try:
+            await self.dead_letters.push("user-events", encode_event(event), repr(exc))
+        except Exception as push_exc:  # pylint: disable=broad-exception-caught
+            logger.error(f"Could not dead-letter user event {user_id}: {push_exc}")
+            return False
+        return True
+
+    @staticmethod
+    async def _ack(entry: PendingUser):
+        for ack in entry.acks:
+            await ack()
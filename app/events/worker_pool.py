@@ -0,0 +1,85 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+from app.core.logging_config import logger
+
+ItemType = TypeVar("ItemType")
+
+
+class PartitionedWorkerPool(Generic[ItemType]):
+    """
+    Run a handler over submitted items with bounded concurrency.
+
+    Items are routed to one of `concurrency` partitions by hashing their key and
+    each partition is drained by a single worker, so items sharing a key are
+    handled in submission order while different keys run in parallel. Partition
+    queues are bounded: `submit` waits while the target queue is full, pushing
+    back on the producer instead of buffering without limit.
+
+    Workers hand the handler whatever is queued, up to `max_batch` items at a
+    time, so per-batch setup such as opening a session is amortised under load.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[ItemType]], Awaitable[None]],
+        concurrency: int,
+        queue_size: int,
+        max_batch: int = 1,
+    ):
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+        self.handler = handler
+        self.max_batch = max_batch
+        self.queues: list[asyncio.Queue] = [
+            asyncio.Queue(maxsize=queue_size) for _ in range(concurrency)
+        ]
+        self.workers: list[asyncio.Task] = []
+        self.in_flight = 0
+
+    @property
+    def depth(self) -> int:
+        return sum(queue.qsize() for queue in self.queues)
+
+    def start(self):
+        if self.workers:
+            return
+        logger.info(f"Starting worker pool with {len(self.queues)} partitions")
+        self.workers = [
+            asyncio.create_task(self._work(queue), name=f"event-worker-{index}")
+            for index, queue in enumerate(self.queues)
+        ]
+
+    async def submit(self, key: Hashable, item: ItemType):
+        queue = self.queues[hash(key) % len(self.queues)]
+        if queue.full():
+            logger.debug(f"Partition for key {key} is full, waiting for capacity")
+        await queue.put(item)
+
+    async def join(self):
+        await asyncio.gather(*(queue.join() for queue in self.queues))
+
+    async def stop(self, drain: bool = True):
+        if drain:
+            await self.join()
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+        logger.info("Worker pool stopped")
+
+    async def _work(self, queue: asyncio.Queue):
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            self.in_flight += len(batch)
+            try:
+                await self.handler(batch)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logger.exception(f"Error handling batch of {len(batch)}: {exc}")
+            finally:
+                self.in_flight -= len(batch)
+                for _ in batch:
+                    queue.task_done()
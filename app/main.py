@@ -1,19 +1,25 @@
 import asyncio
-from builtins import anext
 from contextlib import asynccontextmanager
 import os
 
 from dotenv import load_dotenv
 from fastapi import FastAPI
 
-from app.api.routes import meeting_routes, recurrence_routes, task_routes, user_routes
-from app.core.dependencies import (
-    get_db,
-    get_redis_client,
-    get_task_service,
-    get_user_service,
+from app.api.routes import (
+    admin_routes,
+    import_routes,
+    meeting_routes,
+    metrics_routes,
+    recurrence_routes,
+    task_routes,
+    user_routes,
 )
+from app.core.dependencies import get_binary_redis_client, get_redis_client
 from app.core.logging_config import logger
+from app.db.db import AsyncSessionLocal
+from app.events.bus import get_event_bus
+from app.events.outbox_relay import OutboxRelay
+from app.events.publisher import close_event_publishers
 from app.exceptions import (
     NotFoundError,
     ValidationError,
@@ -42,22 +48,20 @@ async def test_redis_connection(redis_client):
 async def lifespan(fastapi_app: FastAPI):
     logger.info("Lifespan startup")
 
-    # Resolve database session manually
-    db_session_generator = get_db()  # This is an async generator
-    db_session = await anext(db_session_generator)  # Get the first yielded value
-
     redis_client = get_redis_client()
 
-    user_service = get_user_service(db=db_session, redis=redis_client)
-    task_service = get_task_service(db=db_session, redis=redis_client)
-
     subscriber = RedisSubscriber(
-        redis_client=redis_client, task_service=task_service, user_service=user_service
+        redis_client=get_binary_redis_client(), session_factory=AsyncSessionLocal
     )
 
     fastapi_app.state.redis_subscriber_task = asyncio.create_task(
         subscriber.listen_to_events(["user-events", "meeting-events"])
     )
+    fastapi_app.state.outbox_relay_task = None
+    if get_event_bus(redis_client).uses_outbox:
+        fastapi_app.state.outbox_relay_task = asyncio.create_task(
+            OutboxRelay(AsyncSessionLocal, redis_client).run()
+        )
 
     yield
 
@@ -66,8 +70,14 @@ async def lifespan(fastapi_app: FastAPI):
         await fastapi_app.state.redis_subscriber_task
     except asyncio.CancelledError:
         logger.warning("Redis subscriber task cancelled.")
+    if fastapi_app.state.outbox_relay_task:
+        fastapi_app.state.outbox_relay_task.cancel()
+        try:
+            await fastapi_app.state.outbox_relay_task
+        except asyncio.CancelledError:
+            logger.warning("Outbox relay task cancelled.")
+    await close_event_publishers()
 
-    await db_session_generator.aclose()  # Close the async generator
     logger.info("Lifespan shutdown complete.")
 
 
@@ -93,6 +103,9 @@ app.include_router(
     prefix="/recurrences",
     tags=["recurrences"],
 )
+app.include_router(import_routes.router, prefix="/imports", tags=["imports"])
+app.include_router(metrics_routes.router, tags=["metrics"])
+app.include_router(admin_routes.router, prefix="/admin", tags=["admin"])
 
 
 @app.get("/")
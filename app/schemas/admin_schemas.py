@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class DeadLetter(BaseModel):
+    channel: str
+    error: str
+    attempts: int
+    failed_at: datetime
+    data: Optional[str] = None
+    data_b64: Optional[str] = None
+
+
+class DeadLetterReplayResult(BaseModel):
+    replayed: int
+    remaining: int
@@ -0,0 +1,67 @@
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class ImportKind(str, Enum):
+    MEETINGS = "meetings"
+    MEETING_USERS = "meeting_users"
+    MEETING_TASKS = "meeting_tasks"
+    TASKS = "tasks"
+
+
+class ImportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class MeetingImportRow(BaseModel):
+    id: int
+    recurrence_id: Optional[int] = None
+    title: str = ""
+    start_date: datetime
+    duration: int = 30
+    location: str = ""
+    notes: Optional[str] = None
+    num_reschedules: int = 0
+    reminder_sent: bool = False
+    completed: bool = False
+
+
+class MeetingUserImportRow(BaseModel):
+    meeting_id: int
+    user_id: UUID
+
+
+class MeetingTaskImportRow(BaseModel):
+    meeting_id: int
+    task_id: int
+
+
+class TaskImportRow(BaseModel):
+    id: int
+    assignee_id: Optional[int] = None
+    title: str = ""
+    description: str = ""
+    due_date: Optional[datetime] = None
+    completed: bool = False
+    completed_date: Optional[datetime] = None
+
+
+class ImportReject(BaseModel):
+    line: int
+    error: str
+
+
+class ImportResult(BaseModel):
+    kind: ImportKind
+    received: int
+    imported: int
+    skipped: int
+    rejected: int
+    elapsed_seconds: float
+    rows_per_second: float
+    rejects: list[ImportReject]
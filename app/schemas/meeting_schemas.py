@@ -33,6 +33,7 @@ class MeetingRetrieve(MeetingBase):
     start_date: datetime
     duration: int
     recurrence: Optional[RecurrenceRetrieve]
+    updated_at: Optional[datetime] = None
 
 
 class MeetingCreateBatch(BaseModel):
@@ -31,5 +31,6 @@ class TaskRetrieve(BaseModel):
     completed: bool
     completed_date: Optional[datetime] = None
     due_date: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
@@ -1,4 +1,3 @@
-import json
 from typing import Generic, TypeVar, Union
 from uuid import UUID
 
@@ -7,6 +6,8 @@ from pydantic import BaseModel
 from app.core.logging_config import logger
 from app.core.redis_client import RedisClient
 from app.db.repositories import BaseRepository
+from app.events.bus import get_event_bus
+from app.events.envelope import EventEnvelope, encode_event
 from app.exceptions import NotFoundError
 
 ModelType = TypeVar("ModelType")
@@ -24,15 +25,15 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         return self.repo.model.__name__
 
     async def _publish_event(self, event_type: str, payload: dict):
-        event = {
-            "event_type": event_type,
-            "model": self._get_model_name(),
-            "payload": payload,
-        }
+        event = EventEnvelope(event_type, self._get_model_name(), payload)
         channel = f"{self._get_model_name().lower()}-events"
-        logger.info(f"Publishing event to channel {channel}: {event}")
-        logger.info(f"Redis client: {self.redis_client}")
-        await self.redis_client.publish(channel, json.dumps(event, default=str))
+        logger.debug(f"Publishing {event_type} event to channel {channel}")
+        bus = get_event_bus(self.redis_client)
+        if bus.uses_outbox:
+            # Committed with the caller's next commit, published by the relay
+            self.repo.stage_event(channel, encode_event(event))
+            return
+        await bus.publish(channel, event)
 
     async def create(self, create_data: CreateSchemaType) -> ModelType:
         logger.info(f"Creating {self.model_name} with data: {create_data.model_dump()}")
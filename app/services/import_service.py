@@ -0,0 +1,124 @@
+import csv
+import io
+import json
+import time
+from typing import IO, AsyncIterator, Callable, Iterator
+
+from pydantic import BaseModel
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy import Table
+
+from app.core.config import settings
+from app.core.logging_config import logger
+from app.db.models.meeting import Meeting
+from app.db.models.relationships import meeting_tasks, meeting_users
+from app.db.models.task import Task
+from app.db.repositories.import_repo import ImportRepository
+from app.schemas.import_schemas import (
+    ImportFormat,
+    ImportKind,
+    ImportReject,
+    ImportResult,
+    MeetingImportRow,
+    MeetingTaskImportRow,
+    MeetingUserImportRow,
+    TaskImportRow,
+)
+
+IMPORT_TARGETS: dict[ImportKind, tuple[Table, type[BaseModel]]] = {
+    ImportKind.MEETINGS: (Meeting.__table__, MeetingImportRow),
+    ImportKind.MEETING_USERS: (meeting_users, MeetingUserImportRow),
+    ImportKind.MEETING_TASKS: (meeting_tasks, MeetingTaskImportRow),
+    ImportKind.TASKS: (Task.__table__, TaskImportRow),
+}
+
+
+class ImportService:
+    def __init__(
+        self,
+        repo: ImportRepository,
+        chunk_size: int = settings.IMPORT_CHUNK_SIZE,
+        max_rejects: int = settings.IMPORT_MAX_REJECTS,
+    ):
+        self.repo = repo
+        self.chunk_size = chunk_size
+        self.max_rejects = max_rejects
+
+    async def import_rows(
+        self, kind: ImportKind, fmt: ImportFormat, stream: IO[bytes]
+    ) -> ImportResult:
+        logger.info(f"Importing {kind.value} from {fmt.value}")
+        table, schema = IMPORT_TARGETS[kind]
+        columns = list(schema.model_fields)
+        received = 0
+        accepted = 0
+        rejects: list[ImportReject] = []
+        rejected = 0
+
+        def reject(line: int, error: str):
+            nonlocal rejected
+            rejected += 1
+            if len(rejects) < self.max_rejects:
+                rejects.append(ImportReject(line=line, error=error))
+
+        async def chunks() -> AsyncIterator[list[dict]]:
+            nonlocal received, accepted
+            batch = []
+            for line, record in self._read_records(fmt, stream, reject):
+                received += 1
+                try:
+                    batch.append(schema.model_validate(record).model_dump())
+                except PydanticValidationError as exc:
+                    reject(line, str(exc))
+                    continue
+                accepted += 1
+                if len(batch) >= self.chunk_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+        start_time = time.perf_counter()
+        imported = await self.repo.load_rows(table, columns, chunks())
+        elapsed = time.perf_counter() - start_time
+
+        result = ImportResult(
+            kind=kind,
+            received=received,
+            imported=imported,
+            skipped=accepted - imported,
+            rejected=rejected,
+            elapsed_seconds=round(elapsed, 3),
+            rows_per_second=round(imported / elapsed, 1) if elapsed else 0.0,
+            rejects=rejects,
+        )
+        logger.info(
+            f"Imported {imported} {kind.value} at {result.rows_per_second} rows/s "
+            f"({result.skipped} skipped, {rejected} rejected)"
+        )
+        return result
+
+    @staticmethod
+    def _read_records(
+        fmt: ImportFormat, stream: IO[bytes], reject: Callable[[int, str], None]
+    ) -> Iterator[tuple[int, dict]]:
+        text_stream = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+        if fmt == ImportFormat.CSV:
+            reader = csv.DictReader(text_stream)
+            for record in reader:
+                # Empty cells fall back to the schema defaults
+                yield reader.line_num, {k: v for k, v in record.items() if v != ""}
+            return
+
+        for line, raw in enumerate(text_stream, start=1):
+            if not raw.strip():
+                continue
+            try:
+                record = json.loads(raw)
+            except json.JSONDecodeError as exc:
+                reject(line, f"Invalid JSON: {exc}")
+                continue
+            if not isinstance(record, dict):
+                reject(line, "Expected a JSON object")
+                continue
+            yield line, record
@@ -1,6 +1,8 @@
 from datetime import datetime, timedelta
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
+from app.core.config import settings
 from app.core.logging_config import logger
 from app.db.models.meeting import Meeting
 from app.db.repositories.meeting_repo import MeetingRepository
@@ -25,6 +27,29 @@ class MeetingService(BaseService[Meeting, MeetingCreate, MeetingUpdate]):
         logger.info(f"Retrieved {len(meetings)} meetings for user with ID: {user_id}")
         return [MeetingRetrieve.model_validate(meeting) for meeting in meetings]
 
+    async def export_meetings(
+        self,
+        updated_since: Optional[datetime] = None,
+        start_after: Optional[datetime] = None,
+        start_before: Optional[datetime] = None,
+    ) -> AsyncIterator[MeetingRetrieve]:
+        logger.info(
+            f"Exporting meetings updated_since={updated_since}, "
+            f"start_after={start_after}, start_before={start_before}"
+        )
+        criteria = []
+        if updated_since:
+            criteria.append(Meeting.updated_at >= updated_since)
+        if start_after:
+            criteria.append(Meeting.start_date >= start_after)
+        if start_before:
+            criteria.append(Meeting.start_date < start_before)
+
+        async for meeting in self.repo.stream_all(
+            criteria, yield_per=settings.EXPORT_YIELD_PER
+        ):
+            yield MeetingRetrieve.model_validate(meeting)
+
     async def complete_meeting(self, meeting_id: int) -> MeetingRetrieve:
         logger.info(f"Completing meeting with ID: {meeting_id}")
         meeting = await self.repo.get_by_id(meeting_id)
@@ -36,7 +61,8 @@ class MeetingService(BaseService[Meeting, MeetingCreate, MeetingUpdate]):
         next_meeting = await self.get_subsequent_meeting(meeting_id)
         next_meeting_id = next_meeting.id if next_meeting else None
 
-        # Publish event with both source and target meeting IDs
+        # Publish event with both source and target meeting IDs. With the outbox
+        # enabled this is only staged and commits together with the update below
         await self._publish_event(
             event_type="complete",
             payload={
@@ -1,90 +1,341 @@
-import json
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Hashable, Optional
+from uuid import UUID
 
 from pydantic import ValidationError
 from redis.exceptions import ConnectionError as RedisConnectionError
 from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
 
+from app.core.config import settings
 from app.core.logging_config import logger
+from app.core.metrics import Counter, Gauge, Histogram
+from app.db.repositories.task_repo import TaskRepository
+from app.events.bus import get_event_bus
+from app.events.dead_letter import DeadLetterQueue
+from app.events.dedup import EventDeduplicator
+from app.events.envelope import EventEnvelope, decode_event
+from app.events.transport import Delivery
+from app.events.user_batcher import UserUpsertBatcher
+from app.events.worker_pool import PartitionedWorkerPool
 from app.schemas.user_schemas import UserCreate, UserUpdate
 from app.services.task_service import TaskService
-from app.services.user_service import UserService
+
+# Errors that retrying the same event cannot fix
+PERMANENT_ERRORS = (ValidationError, ValueError, KeyError, TypeError)
+
+EVENT_LABELS = ("channel", "event_type")
+
+events_received_total = Counter(
+    "subscriber_events_received_total", "Events received", labels=EVENT_LABELS
+)
+events_handled_total = Counter(
+    "subscriber_events_handled_total",
+    "Events handled successfully",
+    labels=EVENT_LABELS,
+)
+events_failed_total = Counter(
+    "subscriber_events_failed_total",
+    "Events given up on and dead-lettered",
+    labels=EVENT_LABELS,
+)
+event_retries_total = Counter(
+    "subscriber_event_retries_total",
+    "Failed attempts that were retried",
+    labels=EVENT_LABELS,
+)
+handler_seconds = Histogram(
+    "subscriber_handler_seconds", "Time taken to handle one event", labels=EVENT_LABELS
+)
+event_lag_seconds = Histogram(
+    "subscriber_event_lag_seconds",
+    "Time from publish to the start of handling",
+    labels=("channel",),
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 15, 30, 60, 300, 900, 3600),
+)
+current_lag_seconds = Gauge(
+    "subscriber_current_lag_seconds",
+    "Publish-to-handling lag of the most recent event",
+    labels=("channel",),
+)
+in_flight_gauge = Gauge("subscriber_in_flight", "Events currently being handled")
+queue_depth_gauge = Gauge(
+    "subscriber_queue_depth", "Events received and waiting for a worker"
+)
+
+
+def filter_valid_fields(data_dict: dict, schema) -> dict:
+    return {
+        key: value for key, value in data_dict.items() if key in schema.model_fields
+    }
 
 
 class RedisSubscriber:
     def __init__(
-        self, redis_client, task_service: TaskService, user_service: UserService
+        self,
+        redis_client,
+        session_factory: sessionmaker[AsyncSession],
+        concurrency: int = settings.SUBSCRIBER_CONCURRENCY,
+        queue_size: int = settings.SUBSCRIBER_QUEUE_SIZE,
+        batch_size: int = settings.SUBSCRIBER_BATCH_SIZE,
+        max_attempts: int = settings.SUBSCRIBER_MAX_ATTEMPTS,
+        retry_delay_ms: int = settings.SUBSCRIBER_RETRY_DELAY_MS,
+        reconnect_base_ms: int = settings.SUBSCRIBER_RECONNECT_BASE_MS,
+        reconnect_max_ms: int = settings.SUBSCRIBER_RECONNECT_MAX_MS,
+        transport=None,
+        bus=None,
     ):
         self.redis_client = redis_client
-        self.task_service = task_service
-        self.user_service = user_service
+        self.session_factory = session_factory
+        self.bus = bus or get_event_bus(redis_client, transport)
+        self.pool = PartitionedWorkerPool(
+            self._process_batch,
+            concurrency=concurrency,
+            queue_size=queue_size,
+            max_batch=batch_size,
+        )
+        self.max_attempts = max_attempts
+        self.retry_delay_ms = retry_delay_ms
+        self.reconnect_base_ms = reconnect_base_ms
+        self.reconnect_max_ms = reconnect_max_ms
+        self.delivered = False
+        # An in-process bus never redelivers and must work without Redis
+        self.dead_letters: Optional[DeadLetterQueue] = None
+        self.dedup: Optional[EventDeduplicator] = None
+        if not self.bus.is_local:
+            self.dead_letters = DeadLetterQueue(redis_client, self.bus.transport)
+            self.dedup = EventDeduplicator(redis_client)
+        self.user_batcher = UserUpsertBatcher(
+            session_factory, dead_letters=self.dead_letters
+        )
+
+    @staticmethod
+    def partition_key(event: EventEnvelope, channel: str) -> Hashable:
+        """Key that must be handled in order: the meeting or user the event is for"""
+        payload = event.payload
+        if channel == "meeting-events":
+            return channel, payload.get("meeting_id")
+        if channel == "user-events":
+            return channel, payload.get("id")
+        return channel, None
 
     async def listen_to_events(self, channels: list[str]):
+        """
+        Consume until cancelled. A dropped connection or any other error in
+        the consumer loop is logged, and the subscription is re-established
+        after a jittered exponential backoff.
+        """
+        self.pool.start()
+        failures = 0
+        try:
+            while True:
+                self.delivered = False
+                try:
+                    await self.bus.consume(channels, self._deliver)
+                    logger.warning("Event consumer stopped, resubscribing")
+                except (RedisConnectionError, RedisError, OSError) as exc:
+                    logger.warning(f"Lost connection to Redis: {exc}")
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    logger.exception(f"Event consumer failed: {exc}")
+
+                # Start over from the shortest delay once a connection has
+                # delivered events again
+                failures = 1 if self.delivered else failures + 1
+                delay = self._backoff(failures)
+                logger.info(f"Resubscribing to {channels} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+        finally:
+            await self.pool.stop(drain=False)
+            await self.user_batcher.flush()
+
+    def _backoff(self, failures: int) -> float:
+        ceiling = min(
+            self.reconnect_max_ms, self.reconnect_base_ms * 2 ** (failures - 1)
+        )
+        return random.uniform(ceiling / 2, ceiling) / 1000
+
+    async def _deliver(self, delivery: Delivery):
+        self.delivered = True
+        try:
+            event = delivery.data
+            if not isinstance(event, EventEnvelope):
+                event = decode_event(delivery.data)
+        except (ValueError, TypeError, RuntimeError) as exc:
+            labels = {"channel": delivery.channel, "event_type": "undecodable"}
+            events_received_total.inc(**labels)
+            events_failed_total.inc(**labels)
+            await self._dead_letter(delivery, f"Undecodable message: {exc}")
+            return
+        logger.debug(f"Received {event.event_type} event from {delivery.channel}")
+        events_received_total.inc(channel=delivery.channel, event_type=event.event_type)
+        await self.pool.submit(
+            self.partition_key(event, delivery.channel), (event, delivery)
+        )
+        queue_depth_gauge.set(self.pool.depth)
+
+    async def _process_batch(self, items: list[tuple[EventEnvelope, Delivery]]):
+        queue_depth_gauge.set(self.pool.depth)
+        in_flight_gauge.inc(len(items))
+        # One short-lived session per batch: the connection goes back to the
+        # pool and the identity map is dropped as soon as the batch is done
+        try:
+            async with self.session_factory() as session:
+                for event, delivery in items:
+                    await self._handle_with_retries(event, delivery, session)
+        finally:
+            in_flight_gauge.dec(len(items))
+
+    @staticmethod
+    def _observe_lag(event: EventEnvelope, channel: str):
+        # Events from producers that predate the envelope carry no timestamp
+        if not event.ts:
+            return
+        lag = max(time.time() - event.ts, 0.0)
+        event_lag_seconds.observe(lag, channel=channel)
+        current_lag_seconds.set(lag, channel=channel)
+
+    async def _handle_with_retries(
+        self, event: EventEnvelope, delivery: Delivery, session: AsyncSession
+    ):
+        if self.dedup and not await self.dedup.claim(event.id):
+            logger.info(f"Skipping duplicate {event.event_type} event {event.id}")
+            if delivery.ack:
+                await delivery.ack()
+            return
+
+        self._observe_lag(event, delivery.channel)
+        labels = {"channel": delivery.channel, "event_type": event.event_type}
+        for attempt in range(1, self.max_attempts + 1):
+            started = time.perf_counter()
+            try:
+                await self.handle_event(
+                    event, delivery.channel, ack=delivery.ack, session=session
+                )
+                handler_seconds.observe(time.perf_counter() - started, **labels)
+                events_handled_total.inc(**labels)
+                return
+            except PERMANENT_ERRORS as exc:
+                # Retrying cannot fix a malformed event
+                await session.rollback()
+                await self._release(event)
+                events_failed_total.inc(**labels)
+                await self._dead_letter(delivery, repr(exc), attempt)
+                return
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                # Give the next attempt, and the next event, a clean slate
+                logger.warning(
+                    f"Attempt {attempt} at {event.event_type} event failed: {exc}"
+                )
+                await session.rollback()
+                if attempt == self.max_attempts:
+                    await self._release(event)
+                    events_failed_total.inc(**labels)
+                    await self._dead_letter(delivery, repr(exc), attempt)
+                    return
+                event_retries_total.inc(**labels)
+                await asyncio.sleep(self.retry_delay_ms * attempt / 1000)
+
+    async def _release(self, event: EventEnvelope):
+        if self.dedup:
+            await self.dedup.release(event.id)
+
+    async def _dead_letter(self, delivery: Delivery, error: str, attempts: int = 1):
+        """Quarantine an event and ack it, so it no longer blocks the stream"""
+        if self.dead_letters is None:
+            logger.error(f"Dropping event from {delivery.channel}: {error}")
+            return
         try:
-            pubsub = self.redis_client.pubsub()
-            await pubsub.subscribe(*channels)
-            logger.info(f"Subscribed to {channels} channel.")
-
-            async for message in pubsub.listen():
-                logger.info(f"Received message: {message}")
-                if message["type"] == "message":
-                    event = json.loads(message["data"])
-                    logger.info(f"Received message from {message['channel']}: {event}")
-                    await self.handle_event(event, channel=message["channel"])
-        except (
-            RedisConnectionError,
-            RedisError,
-            ValueError,
-            TypeError,
-            json.JSONDecodeError,
-        ) as exc:
-            logger.warning(f"Error in listening to events: {exc}")
-
-    async def handle_event(self, event: dict, channel: str):
-        event_type = event["event_type"]
-        event_data = event["payload"]
-
-        def filter_valid_fields(data_dict, schema):
-            return {
-                key: value
-                for key, value in data_dict.items()
-                if key in schema.model_fields
-            }
+            await self.dead_letters.push(
+                delivery.channel, delivery.data, error, attempts
+            )
+        except RedisError as exc:
+            # Left unacked, a durable transport will deliver it again
+            logger.error(f"Could not dead-letter event from {delivery.channel}: {exc}")
+            return
+        if delivery.ack:
+            await delivery.ack()
+
+    async def handle_event(
+        self,
+        event: EventEnvelope,
+        channel: str,
+        ack: Optional[Callable[[], Awaitable[None]]] = None,
+        session: Optional[AsyncSession] = None,
+    ):
+        """
+        Apply an event. `ack` is awaited once the event's changes are committed,
+        which for batched user-events happens when the batch is flushed.
+        Without a `session`, one is opened just for this event.
+        """
+        if session is None:
+            async with self.session_factory() as session:
+                return await self.handle_event(event, channel, ack, session)
+
+        event_type = event.event_type
+        event_data = event.payload
 
         try:
             if channel == "user-events":
-                match event_type:
-                    case "create":
-                        filtered_data = filter_valid_fields(event_data, UserCreate)
-                        user_data = UserCreate.model_validate(filtered_data)
-                        await self.user_service.create(user_data)
-                    case "update":
-                        filtered_data = filter_valid_fields(event_data, UserUpdate)
-                        user_data = UserUpdate.model_validate(filtered_data)
-                        await self.user_service.update(user_data)
-                    case "delete":
-                        if user_id := event_data.get("id"):
-                            await self.user_service.delete(user_id)
-                        else:
-                            raise ValueError(
-                                "Delete event must include 'id' in payload"
-                            )
-                    case _:
-                        raise ValueError(f"Unsupported event type: {event_type}")
-            elif channel == "meeting-events":
-                if event_type == "complete":
-                    meeting_id = event_data["meeting_id"]
-                    next_meeting_id = event_data["next_meeting_id"]
-
-                    if meeting_id:
-                        await self.task_service.reassign_tasks_to_meeting(
-                            meeting_id, next_meeting_id
-                        )
-                    else:
-                        logger.warning(
-                            f"Next meeting for completed M:{meeting_id} not found"
-                        )
+                await self._handle_user_event(event_type, event_data, ack)
+                return
+            if channel == "meeting-events":
+                await self._handle_meeting_event(event_type, event_data, session)
             else:
                 logger.warning(f"Unhandled channel: {channel}")
         except ValidationError as e:
             logger.error(f"Validation error for event {event_type}: {e}")
             raise
+
+        # Only acknowledge once handled, so failures are redelivered
+        if ack:
+            await ack()
+
+    async def _handle_user_event(
+        self,
+        event_type: str,
+        event_data: dict,
+        ack: Optional[Callable[[], Awaitable[None]]],
+    ):
+        match event_type:
+            case "create":
+                filtered_data = filter_valid_fields(event_data, UserCreate)
+                user_data = UserCreate.model_validate(filtered_data)
+                await self.user_batcher.upsert(
+                    user_data.id,
+                    user_data.model_dump(exclude_unset=True, exclude={"id"}),
+                    ack,
+                )
+            case "update":
+                if not (user_id := event_data.get("id")):
+                    raise ValueError("Update event must include 'id' in payload")
+                filtered_data = filter_valid_fields(event_data, UserUpdate)
+                user_data = UserUpdate.model_validate(filtered_data)
+                await self.user_batcher.upsert(
+                    UUID(str(user_id)), user_data.model_dump(exclude_unset=True), ack
+                )
+            case "delete":
+                if user_id := event_data.get("id"):
+                    await self.user_batcher.delete(UUID(str(user_id)), ack)
+                else:
+                    raise ValueError("Delete event must include 'id' in payload")
+            case _:
+                raise ValueError(f"Unsupported event type: {event_type}")
+
+    async def _handle_meeting_event(
+        self, event_type: str, event_data: dict, session: AsyncSession
+    ):
+        if event_type != "complete":
+            return
+
+        meeting_id = event_data["meeting_id"]
+        next_meeting_id = event_data["next_meeting_id"]
+
+        if not meeting_id:
+            logger.warning(f"Next meeting for completed M:{meeting_id} not found")
+            return
+
+        task_service = TaskService(TaskRepository(session), self.redis_client)
+        await task_service.reassign_tasks_to_meeting(meeting_id, next_meeting_id)
@@ -1,3 +1,7 @@
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from app.core.config import settings
 from app.core.logging_config import logger
 from app.db.models.task import Task
 from app.db.repositories.task_repo import TaskRepository
@@ -22,6 +26,29 @@ class TaskService(BaseService[Task, TaskCreate, TaskUpdate]):
             raise NotFoundError(detail=f"Task with ID {task_id} not found")
         return TaskRetrieve.model_validate(task)
 
+    async def export_tasks(
+        self,
+        updated_since: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        due_before: Optional[datetime] = None,
+    ) -> AsyncIterator[TaskRetrieve]:
+        logger.info(
+            f"Exporting tasks updated_since={updated_since}, "
+            f"due_after={due_after}, due_before={due_before}"
+        )
+        criteria = []
+        if updated_since:
+            criteria.append(Task.updated_at >= updated_since)
+        if due_after:
+            criteria.append(Task.due_date >= due_after)
+        if due_before:
+            criteria.append(Task.due_date < due_before)
+
+        async for task in self.repo.stream_all(
+            criteria, yield_per=settings.EXPORT_YIELD_PER
+        ):
+            yield TaskRetrieve.model_validate(task)
+
     async def reassign_tasks_to_meeting(
         self, source_meeting_id: int, target_meeting_id: int
     ):
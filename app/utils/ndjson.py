@@ -0,0 +1,16 @@
+from typing import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def _encode_lines(items: AsyncIterator[BaseModel]) -> AsyncIterator[str]:
+    async for item in items:
+        yield item.model_dump_json() + "\n"
+
+
+def ndjson_response(items: AsyncIterator[BaseModel]) -> StreamingResponse:
+    """Stream pydantic models as newline-delimited JSON, one object per line."""
+    return StreamingResponse(_encode_lines(items), media_type=NDJSON_MEDIA_TYPE)
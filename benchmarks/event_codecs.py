@@ -0,0 +1,69 @@
+"""
+Compare encode and decode throughput and message size of the event codecs.
+
+Run from the repository root:
+
+    python -m benchmarks.event_codecs [--events 100000]
+"""
+
+import argparse
+from datetime import datetime, timezone
+import time
+import uuid
+
+from app.events.envelope import CODECS, EventEnvelope, decode_event, get_event_codec
+
+
+def sample_events(count: int) -> list[EventEnvelope]:
+    now = datetime.now(timezone.utc)
+    return [
+        EventEnvelope(
+            "update",
+            "User",
+            {
+                "id": uuid.uuid4(),
+                "email": f"user{i}@example.com",
+                "first_name": "Ada",
+                "last_name": "Lovelace",
+                "updated_at": now,
+            },
+        )
+        for i in range(count)
+    ]
+
+
+def bench(codec_name: str, events: list[EventEnvelope]):
+    codec = get_event_codec(codec_name)
+
+    started = time.perf_counter()
+    encoded = [codec.encode(event) for event in events]
+    encode_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for message in encoded:
+        decode_event(message)
+    decode_seconds = time.perf_counter() - started
+
+    size = sum(len(message) for message in encoded) / len(encoded)
+    print(
+        f"{codec_name:8} encode {len(events) / encode_seconds:>10,.0f}/s  "
+        f"decode {len(events) / decode_seconds:>10,.0f}/s  "
+        f"avg size {size:6.1f} B"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=100_000)
+    args = parser.parse_args()
+
+    events = sample_events(args.events)
+    for codec_name in CODECS:
+        try:
+            bench(codec_name, events)
+        except RuntimeError as exc:
+            print(f"{codec_name:8} skipped: {exc}")
+
+
+if __name__ == "__main__":
+    main()
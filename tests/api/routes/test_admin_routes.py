@@ -0,0 +1,69 @@
+import base64
+import json
+
+import pytest
+
+
+def dead_letter(channel, **data):
+    return json.dumps(
+        {
+            "channel": channel,
+            "error": "KeyError('meeting_id')",
+            "attempts": 1,
+            "failed_at": "2025-03-01T12:00:00+00:00",
+            **data,
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_dead_letters(test_client, mock_redis_client):
+    mock_redis_client.lrange.return_value = [
+        dead_letter("user-events", data_b64=base64.b64encode(b"\x85").decode()),
+        dead_letter("meeting-events", data='{"event_type": "complete"}'),
+    ]
+
+    response = await test_client.get("/admin/dead-letters?limit=2")
+
+    assert response.status_code == 200
+    entries = response.json()
+    mock_redis_client.lrange.assert_awaited_once_with("events:dead-letter", -2, -1)
+    # Oldest entry first
+    assert [entry["channel"] for entry in entries] == ["meeting-events", "user-events"]
+    assert entries[0]["data"] == '{"event_type": "complete"}'
+
+
+@pytest.mark.asyncio
+async def test_replay_dead_letters(test_client, mock_redis_client):
+    mock_redis_client.rpop.return_value = [
+        dead_letter("meeting-events", data='{"event_type": "complete"}'),
+        dead_letter("user-events", data_b64=base64.b64encode(b"\x85").decode()),
+    ]
+    mock_redis_client.llen.return_value = 3
+
+    response = await test_client.post("/admin/dead-letters/replay?limit=2")
+
+    assert response.status_code == 200
+    assert response.json() == {"replayed": 2, "remaining": 3}
+    published = [
+        call.args
+        for call in mock_redis_client.pipeline.return_value.publish.call_args_list
+    ]
+    assert published == [
+        ("meeting-events", '{"event_type": "complete"}'),
+        ("user-events", b"\x85"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_replay_restores_entries_when_publish_fails(
+    test_client, mock_redis_client
+):
+    raw = [dead_letter("meeting-events", data="{}")]
+    mock_redis_client.rpop.return_value = raw
+    mock_redis_client.pipeline.return_value.execute.side_effect = ConnectionError()
+
+    response = await test_client.post("/admin/dead-letters/replay")
+
+    assert response.status_code == 400
+    mock_redis_client.rpush.assert_awaited_once_with("events:dead-letter", *raw)
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_import_meetings_ndjson(test_client):
+    lines = [
+        json.dumps({"id": 101, "title": "Kickoff", "start_date": "2024-01-01T09:00"}),
+        json.dumps({"id": 102, "title": "Retro", "start_date": "not-a-date"}),
+        "{broken",
+        json.dumps({"id": 103, "title": "Review", "start_date": "2024-01-08T09:00"}),
+    ]
+    response = await test_client.post(
+        "/imports/meetings",
+        files={"file": ("meetings.ndjson", "\n".join(lines).encode())},
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert result["imported"] == 2
+    assert result["rejected"] == 2
+    assert [reject["line"] for reject in result["rejects"]] == [2, 3]
+
+    response = await test_client.get("/meetings/101")
+    assert response.status_code == 200
+    assert response.json()["title"] == "Kickoff"
+
+    # Re-importing the same rows skips the ones that already exist
+    response = await test_client.post(
+        "/imports/meetings",
+        files={"file": ("meetings.ndjson", lines[0].encode())},
+    )
+    assert response.json()["imported"] == 0
+    assert response.json()["skipped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_import_tasks_csv(test_client):
+    content = (
+        "id,title,assignee_id,due_date,completed\n"
+        "201,Write notes,3,2024-02-01T09:00:00,false\n"
+        "202,Send invite,,,true\n"
+    )
+    response = await test_client.post(
+        "/imports/tasks",
+        params={"fmt": "csv"},
+        files={"file": ("tasks.csv", content.encode())},
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert result["imported"] == 2
+    assert result["rejected"] == 0
+
+    response = await test_client.get("/tasks/202")
+    assert response.status_code == 200
+    assert response.json()["completed"] is True
+    assert response.json()["assignee_id"] is None
@@ -2,6 +2,8 @@ import json
 
 import pytest
 
+from app.events.envelope import decode_event
+from app.events.outbox_relay import OutboxRelay
 from tests.factories import MeetingFactory
 
 
@@ -80,7 +82,7 @@ async def test_create_meeting_with_recurrence_id(test_client):
 
 
 @pytest.mark.asyncio
-async def test_complete_meeting(test_client, mock_redis_client):
+async def test_complete_meeting(test_client, mock_redis_client, session_factory):
     # Generate meeting data
     meeting_data = MeetingFactory.as_dict()
 
@@ -120,19 +122,18 @@ async def test_complete_meeting(test_client, mock_redis_client):
     response = await test_client.post(f"/meetings/{meeting_id}/complete/")
     assert response.status_code == 200
 
-    mock_redis_client.publish.assert_awaited_with(
-        "meeting-events",
-        json.dumps(
-            {
-                "event_type": "complete",
-                "model": "Meeting",
-                "payload": {
-                    "meeting_id": meeting_id,
-                    "next_meeting_id": int(meeting_id) + 1,
-                },
-            }
-        ),
-    )
+    # The event is staged in the outbox and published by the relay
+    mock_redis_client.publish.assert_not_awaited()
+    assert await OutboxRelay(session_factory, mock_redis_client).relay_once() == 1
+
+    channel, message = mock_redis_client.pipeline.return_value.publish.call_args.args
+    event = decode_event(message)
+    assert channel == "meeting-events"
+    assert (event.event_type, event.model) == ("complete", "Meeting")
+    assert event.payload == {
+        "meeting_id": meeting_id,
+        "next_meeting_id": int(meeting_id) + 1,
+    }
 
     # Validate completion
     response = await test_client.get(f"/meetings/{meeting_id}")
@@ -175,3 +176,26 @@ async def test_get_next_meeting(test_client):
     assert response.status_code == 200
     next_meeting = response.json()
     assert next_meeting["recurrence"] == meeting["recurrence"]
+
+
+@pytest.mark.asyncio
+async def test_export_meetings(test_client):
+    titles = []
+    for _ in range(3):
+        meeting_data = MeetingFactory.as_dict()
+        response = await test_client.post("/meetings/", json=meeting_data)
+        assert response.status_code == 200
+        titles.append(meeting_data["title"])
+
+    response = await test_client.get("/meetings/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["title"] for row in rows] == titles
+
+    response = await test_client.get(
+        "/meetings/export", params={"updated_since": "2999-01-01T00:00:00Z"}
+    )
+    assert response.status_code == 200
+    assert response.text == ""
@@ -1,3 +1,6 @@
+from datetime import datetime
+import json
+
 import pytest
 
 from tests.factories import TaskFactory
@@ -50,3 +53,22 @@ async def test_task_router_lifecycle(test_client):
     # Verify deletion
     response = await test_client.get(f"/tasks/{task_id}")
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_export_tasks(test_client):
+    for due_date in ("2024-01-01T09:00:00", "2024-02-01T09:00:00"):
+        task_data = TaskFactory.as_dict(due_date=datetime.fromisoformat(due_date))
+        response = await test_client.post("/tasks/", json=task_data)
+        assert response.status_code == 200
+
+    response = await test_client.get("/tasks/export")
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == 2
+
+    response = await test_client.get(
+        "/tasks/export", params={"due_after": "2024-01-15T00:00:00"}
+    )
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 1
+    assert rows[0]["due_date"].startswith("2024-02-01")
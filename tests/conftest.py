@@ -2,7 +2,7 @@
 Fixtures for testing the FastAPI application
 """
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 from httpx import ASGITransport, AsyncClient
 import pytest
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.dependencies import (
+    get_dead_letter_queue,
     get_meeting_service,
     get_recurrence_service,
     get_task_service,
@@ -21,6 +22,7 @@ from app.db.repositories.meeting_repo import MeetingRepository
 from app.db.repositories.recurrence_repo import RecurrenceRepository
 from app.db.repositories.task_repo import TaskRepository
 from app.db.repositories.user_repo import UserRepository
+from app.events.dead_letter import DeadLetterQueue
 from app.main import app
 from app.services.meeting_service import MeetingService
 from app.services.recurrence_service import RecurrenceService
@@ -65,11 +67,19 @@ async def _db_session(engine):
     await engine.dispose()
 
 
+@pytest.fixture(name="session_factory")
+async def _session_factory(engine, db_session):  # pylint: disable=unused-argument
+    """Session factory on the test database, for code that opens its own sessions"""
+    return sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
 @pytest.fixture(name="mock_redis_client")
 async def _mock_redis_client():
     """Mock Redis client for testing"""
     mock = AsyncMock()
     mock.publish = AsyncMock()
+    mock.pipeline = MagicMock()
+    mock.pipeline.return_value.execute = AsyncMock()
     return mock
 
 
@@ -94,6 +104,10 @@ async def test_client(db_session, mock_redis_client):
         UserRepository(db_session), mock_redis_client
     )
 
+    app.dependency_overrides[get_dead_letter_queue] = lambda: DeadLetterQueue(
+        mock_redis_client
+    )
+
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://testserver"
     ) as client:
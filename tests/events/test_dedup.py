@@ -0,0 +1,91 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.events.dedup import EventDeduplicator, dedup_hits_total
+from app.events.envelope import EventEnvelope, decode_event, encode_event
+from app.events.transport import Delivery
+from app.services.redis_subscriber import RedisSubscriber
+
+
+def redis_with_keys():
+    keys = {}
+
+    async def set_nx(key, value, nx=False, ex=None):  # pylint: disable=unused-argument
+        if nx and key in keys:
+            return None
+        keys[key] = value
+        return True
+
+    async def delete(key):
+        keys.pop(key, None)
+
+    redis = AsyncMock()
+    redis.set.side_effect = set_nx
+    redis.delete.side_effect = delete
+    return redis
+
+
+def test_envelope_ids_are_unique_and_survive_encoding():
+    first, second = EventEnvelope("create", "User"), EventEnvelope("create", "User")
+
+    assert first.id != second.id
+    assert decode_event(encode_event(first)).id == first.id
+
+
+@pytest.mark.asyncio
+async def test_dedup_catches_duplicates_locally_and_in_redis():
+    redis = redis_with_keys()
+    local_hits = dedup_hits_total.get(layer="local")
+    redis_hits = dedup_hits_total.get(layer="redis")
+    replica_a = EventDeduplicator(redis, namespace="test")
+    replica_b = EventDeduplicator(redis, namespace="test")
+
+    assert await replica_a.claim("event-1") is True
+    # Redelivered to the same replica: answered without a round trip
+    assert await replica_a.claim("event-1") is False
+    assert redis.set.await_count == 1
+    # Delivered to another replica: caught by Redis
+    assert await replica_b.claim("event-1") is False
+
+    assert dedup_hits_total.get(layer="local") == local_hits + 1
+    assert dedup_hits_total.get(layer="redis") == redis_hits + 1
+
+
+@pytest.mark.asyncio
+async def test_released_event_can_be_claimed_again():
+    dedup = EventDeduplicator(redis_with_keys(), namespace="test")
+
+    assert await dedup.claim("event-1") is True
+    await dedup.release("event-1")
+
+    assert await dedup.claim("event-1") is True
+
+
+@pytest.mark.asyncio
+async def test_dedup_lets_events_through_without_id_or_redis():
+    redis = AsyncMock()
+    redis.set.side_effect = RedisConnectionError("down")
+    dedup = EventDeduplicator(redis, namespace="test")
+
+    assert await dedup.claim(None) is True
+    assert await dedup.claim("event-1") is True
+
+
+@pytest.mark.asyncio
+async def test_subscriber_handles_duplicate_event_once(session_factory):
+    redis = redis_with_keys()
+    subscriber = RedisSubscriber(redis, session_factory)
+    subscriber.handle_event = AsyncMock()
+    event = EventEnvelope("complete", "Meeting", {"meeting_id": 1})
+    ack = AsyncMock()
+
+    for _ in range(2):
+        await subscriber._process_batch(  # pylint: disable=protected-access
+            [(event, Delivery("meeting-events", "", ack))]
+        )
+
+    subscriber.handle_event.assert_awaited_once()
+    # The duplicate is acked without being handled
+    ack.assert_awaited_once()
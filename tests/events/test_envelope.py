@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+import json
+import uuid
+
+import pytest
+
+from app.events.envelope import (
+    ENVELOPE_VERSION,
+    EventEnvelope,
+    decode_event,
+    get_event_codec,
+)
+
+
+@pytest.mark.parametrize("codec_name", ["json", "msgpack"])
+def test_envelope_round_trips_and_format_is_detected(codec_name):
+    if codec_name == "msgpack":
+        pytest.importorskip("msgpack")
+    user_id = uuid.uuid4()
+    when = datetime(2025, 3, 1, 12, tzinfo=timezone.utc)
+    envelope = EventEnvelope("update", "User", {"id": user_id, "seen_at": when})
+
+    decoded = decode_event(get_event_codec(codec_name).encode(envelope))
+
+    assert decoded.event_type == "update"
+    assert decoded.model == "User"
+    assert decoded.version == ENVELOPE_VERSION
+    assert decoded.ts == envelope.ts
+    assert decoded.payload == {"id": str(user_id), "seen_at": when.isoformat()}
+
+
+def test_legacy_json_events_are_accepted():
+    legacy = json.dumps(
+        {"event_type": "complete", "model": "Meeting", "payload": {"meeting_id": 1}}
+    )
+
+    decoded = decode_event(legacy)
+
+    assert decoded.event_type == "complete"
+    assert decoded.payload == {"meeting_id": 1}
+    assert decoded.version == 0
+
+
+def test_event_without_type_is_rejected():
+    with pytest.raises(ValueError):
+        decode_event(b'{"payload": {}}')
@@ -0,0 +1,50 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import select
+
+from app.db.models.outbox import OutboxEvent
+from app.db.repositories.outbox_repo import OutboxRepository
+from app.events.outbox_relay import OutboxRelay
+from app.events.transport import PubSubTransport
+
+
+async def _stage(session_factory, count):
+    async with session_factory() as session:
+        repo = OutboxRepository(session)
+        for i in range(count):
+            repo.stage_event("meeting-events", f'{{"n": {i}}}'.encode())
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_relay_publishes_pending_events_in_one_pipeline(session_factory):
+    await _stage(session_factory, 3)
+    redis = AsyncMock()
+    redis.pipeline = MagicMock()
+    redis.pipeline.return_value.execute = AsyncMock()
+    relay = OutboxRelay(session_factory, redis, transport=PubSubTransport(redis))
+
+    assert await relay.relay_once() == 3
+    assert redis.pipeline.return_value.publish.call_count == 3
+    redis.pipeline.return_value.execute.assert_awaited_once()
+
+    # Everything is marked sent, so the next cycle has nothing to do
+    assert await relay.relay_once() == 0
+    async with session_factory() as session:
+        events = (await session.execute(select(OutboxEvent))).scalars().all()
+    assert all(event.sent_at is not None for event in events)
+
+
+@pytest.mark.asyncio
+async def test_relay_keeps_events_pending_when_publish_fails(session_factory):
+    await _stage(session_factory, 2)
+    transport = AsyncMock()
+    transport.publish_many.side_effect = ConnectionError("redis down")
+    relay = OutboxRelay(session_factory, None, transport=transport)
+
+    with pytest.raises(ConnectionError):
+        await relay.relay_once()
+
+    transport.publish_many.side_effect = None
+    assert await relay.relay_once() == 2
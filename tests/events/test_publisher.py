@@ -0,0 +1,100 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.events.publisher import EventPublisher
+
+
+@pytest.mark.asyncio
+async def test_publisher_batches_queued_events():
+    transport = AsyncMock()
+    publisher = EventPublisher(None, batch_size=2, transport=transport)
+
+    for i in range(3):
+        await publisher.publish("meeting-events", str(i))
+    await publisher.close()
+
+    batches = [call.args[0] for call in transport.publish_many.await_args_list]
+    assert batches == [
+        [("meeting-events", "0"), ("meeting-events", "1")],
+        [("meeting-events", "2")],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_publisher_retries_failed_batch():
+    transport = AsyncMock()
+    transport.publish_many.side_effect = [ConnectionError("redis down"), None]
+    publisher = EventPublisher(None, retry_delay_ms=1, transport=transport)
+
+    await publisher.publish("meeting-events", "0")
+    await publisher.close()
+
+    assert transport.publish_many.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_publisher_drops_oldest_when_full():
+    release = asyncio.Event()
+    published = []
+
+    async def publish_many(batch):
+        await release.wait()
+        published.extend(message for _, message in batch)
+
+    transport = AsyncMock()
+    transport.publish_many.side_effect = publish_many
+    publisher = EventPublisher(
+        None, max_size=2, overflow="drop_oldest", transport=transport
+    )
+
+    # The first event is taken by the flusher, which then waits on Redis
+    await publisher.publish("meeting-events", "0")
+    await asyncio.sleep(0)
+    for i in range(1, 4):
+        await publisher.publish("meeting-events", str(i))
+    assert publisher.depth == 2
+
+    release.set()
+    await publisher.close()
+    assert published == ["0", "2", "3"]
+
+
+@pytest.mark.asyncio
+async def test_publisher_spills_to_disk_and_replays(tmp_path):
+    release = asyncio.Event()
+    published = []
+
+    async def publish_many(batch):
+        await release.wait()
+        published.extend(message for _, message in batch)
+
+    transport = AsyncMock()
+    transport.publish_many.side_effect = publish_many
+    spill_path = tmp_path / "spill.ndjson"
+    publisher = EventPublisher(
+        None,
+        max_size=1,
+        overflow="spill",
+        spill_path=str(spill_path),
+        transport=transport,
+    )
+
+    await publisher.publish("meeting-events", "0")
+    await asyncio.sleep(0)
+    for i in range(1, 4):
+        await publisher.publish("meeting-events", str(i))
+    assert spill_path.exists()
+
+    release.set()
+    await publisher.flush()
+    # The spill is replayed by the flusher once the queue has drained
+    for _ in range(10):
+        if not spill_path.exists() and len(published) == 4:
+            break
+        await asyncio.sleep(0.01)
+    await publisher.close()
+
+    assert sorted(published) == ["0", "1", "2", "3"]
+    assert not spill_path.exists()
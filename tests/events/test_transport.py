@@ -0,0 +1,45 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import ResponseError
+
+from app.events.transport import StreamsTransport
+
+
+@pytest.mark.asyncio
+async def test_streams_transport_publishes_with_xadd():
+    redis = AsyncMock()
+    transport = StreamsTransport(redis, maxlen=1000)
+
+    await transport.publish("meeting-events", "{}")
+
+    redis.xadd.assert_awaited_once_with(
+        "meeting-events", {"data": "{}"}, maxlen=1000, approximate=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_streams_transport_reads_group_and_acks():
+    redis = AsyncMock()
+    redis.xgroup_create.side_effect = ResponseError("BUSYGROUP already exists")
+    redis.xautoclaim.return_value = ["0-0", [("1-0", {"data": "stuck"})], []]
+    redis.xreadgroup.side_effect = [
+        [["meeting-events", [("2-0", {"data": "fresh"})]]],
+        asyncio.CancelledError(),
+    ]
+    transport = StreamsTransport(redis, group="svc", consumer="worker-1")
+
+    deliveries = []
+
+    async def deliver(delivery):
+        deliveries.append(delivery)
+
+    with pytest.raises(asyncio.CancelledError):
+        await transport.consume(["meeting-events"], deliver)
+
+    assert [d.data for d in deliveries] == ["stuck", "fresh"]
+    redis.xautoclaim.assert_awaited_once()
+
+    await deliveries[1].ack()
+    redis.xack.assert_awaited_once_with("meeting-events", "svc", "2-0")
@@ -0,0 +1,52 @@
+from unittest.mock import AsyncMock
+import uuid
+
+import pytest
+
+from app.db.models.user import User
+from app.events.user_batcher import UserUpsertBatcher, batch_collapsed_total
+
+
+@pytest.mark.asyncio
+async def test_user_batcher_collapses_updates(db_session, session_factory):
+    batcher = UserUpsertBatcher(session_factory, max_batch=100, max_delay_ms=1000)
+    user_id = uuid.uuid4()
+    ack = AsyncMock()
+    collapsed_before = batch_collapsed_total.get()
+
+    await batcher.upsert(user_id, {"email": "a@example.com", "first_name": "A"}, ack)
+    await batcher.upsert(user_id, {"first_name": "Alice"}, ack)
+    assert ack.await_count == 0
+
+    await batcher.flush()
+
+    user = await db_session.get(User, user_id)
+    assert user.email == "a@example.com"
+    assert user.first_name == "Alice"
+    assert ack.await_count == 2
+    assert batch_collapsed_total.get() == collapsed_before + 1
+
+
+@pytest.mark.asyncio
+async def test_user_batcher_flushes_when_full(db_session, session_factory):
+    batcher = UserUpsertBatcher(session_factory, max_batch=2, max_delay_ms=1000)
+    first, second = uuid.uuid4(), uuid.uuid4()
+
+    await batcher.upsert(first, {"email": "first@example.com"})
+    await batcher.upsert(second, {"email": "second@example.com"})
+
+    assert not batcher.pending
+    assert await db_session.get(User, first) is not None
+    assert await db_session.get(User, second) is not None
+
+
+@pytest.mark.asyncio
+async def test_user_batcher_applies_delete_after_create(db_session, session_factory):
+    batcher = UserUpsertBatcher(session_factory, max_batch=100, max_delay_ms=1000)
+    user_id = uuid.uuid4()
+
+    await batcher.upsert(user_id, {"email": "gone@example.com"})
+    await batcher.delete(user_id)
+    await batcher.flush()
+
+    assert await db_session.get(User, user_id) is None
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from app.events.worker_pool import PartitionedWorkerPool
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_preserves_order_per_key():
+    handled = []
+
+    async def handler(items):
+        for item in items:
+            key, seq = item
+            # Earlier items sleep longer, so reordering within a key would show
+            await asyncio.sleep(0.001 * (5 - seq))
+            handled.append(item)
+
+    pool = PartitionedWorkerPool(handler, concurrency=4, queue_size=10)
+    pool.start()
+    for seq in range(5):
+        for key in ("a", "b", "c"):
+            await pool.submit(key, (key, seq))
+    await pool.stop()
+
+    for key in ("a", "b", "c"):
+        assert [seq for k, seq in handled if k == key] == list(range(5))
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_runs_keys_concurrently():
+    running = 0
+    peak = 0
+
+    async def handler(_items):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    pool = PartitionedWorkerPool(handler, concurrency=8, queue_size=10)
+    pool.start()
+    for key in range(32):
+        await pool.submit(key, key)
+    await pool.stop()
+
+    assert peak > 1
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_applies_backpressure():
+    release = asyncio.Event()
+
+    async def handler(_items):
+        await release.wait()
+
+    pool = PartitionedWorkerPool(handler, concurrency=1, queue_size=1)
+    pool.start()
+    await pool.submit("k", 1)  # picked up by the worker
+    await asyncio.sleep(0)
+    await pool.submit("k", 2)  # fills the queue
+
+    blocked = asyncio.create_task(pool.submit("k", 3))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    release.set()
+    await asyncio.wait_for(blocked, timeout=1)
+    await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_hands_out_batches():
+    batches = []
+
+    async def handler(items):
+        batches.append(items)
+
+    pool = PartitionedWorkerPool(handler, concurrency=1, queue_size=10, max_batch=3)
+    for seq in range(5):
+        await pool.submit("k", seq)
+    pool.start()
+    await pool.stop()
+
+    assert batches == [[0, 1, 2], [3, 4]]
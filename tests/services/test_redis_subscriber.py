@@ -0,0 +1,142 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock
+import uuid
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.db.models.user import User
+from app.events.envelope import EventEnvelope
+from app.events.transport import Delivery
+from app.services.redis_subscriber import (
+    RedisSubscriber,
+    current_lag_seconds,
+    events_failed_total,
+    events_handled_total,
+    in_flight_gauge,
+)
+
+
+@pytest.fixture
+async def subscriber(session_factory, mock_redis_client):
+    return RedisSubscriber(mock_redis_client, session_factory)
+
+
+@pytest.mark.asyncio
+async def test_user_events_are_batched(subscriber, db_session):
+    user_id = uuid.uuid4()
+    ack = AsyncMock()
+
+    await subscriber.handle_event(
+        EventEnvelope(
+            "create", "User", {"id": str(user_id), "email": "new@example.com"}
+        ),
+        channel="user-events",
+        ack=ack,
+    )
+    await subscriber.handle_event(
+        EventEnvelope("update", "User", {"id": str(user_id), "last_name": "Doe"}),
+        channel="user-events",
+        ack=ack,
+    )
+    ack.assert_not_awaited()
+
+    await subscriber.user_batcher.flush()
+
+    user = await db_session.get(User, user_id)
+    assert user.email == "new@example.com"
+    assert user.last_name == "Doe"
+    assert ack.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_event_does_not_poison_batch(subscriber):
+    bad_ack, good_ack = AsyncMock(), AsyncMock()
+    batch = [
+        (EventEnvelope("complete", "Meeting"), Delivery("meeting-events", "", bad_ack)),
+        (
+            EventEnvelope(
+                "complete", "Meeting", {"meeting_id": 1, "next_meeting_id": 2}
+            ),
+            Delivery("meeting-events", "", good_ack),
+        ),
+    ]
+
+    await subscriber._process_batch(batch)  # pylint: disable=protected-access
+
+    # The malformed event is quarantined and acked, the next one still applies
+    bad_ack.assert_awaited_once()
+    good_ack.assert_awaited_once()
+    pipe = subscriber.redis_client.pipeline.return_value
+    key, entry = pipe.lpush.call_args.args
+    assert key == "events:dead-letter"
+    assert json.loads(entry)["channel"] == "meeting-events"
+    assert "KeyError" in json.loads(entry)["error"]
+
+
+@pytest.mark.asyncio
+async def test_transient_failure_is_retried(subscriber):
+    ack = AsyncMock()
+    subscriber.retry_delay_ms = 0
+    subscriber.handle_event = AsyncMock(side_effect=[RuntimeError("db gone"), None])
+
+    await subscriber._process_batch(  # pylint: disable=protected-access
+        [(EventEnvelope("complete", "Meeting"), Delivery("meeting-events", "", ack))]
+    )
+
+    assert subscriber.handle_event.await_count == 2
+    subscriber.redis_client.pipeline.return_value.lpush.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_undecodable_message_is_dead_lettered(subscriber):
+    ack = AsyncMock()
+
+    await subscriber._deliver(  # pylint: disable=protected-access
+        Delivery("meeting-events", b"\xc1 not an event", ack)
+    )
+
+    ack.assert_awaited_once()
+    subscriber.redis_client.pipeline.return_value.lpush.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_listener_resubscribes_after_connection_loss(subscriber):
+    subscriber.reconnect_base_ms = 1
+    subscriber.transport = AsyncMock()
+    subscriber.transport.consume.side_effect = [
+        RedisConnectionError("connection reset"),
+        RedisConnectionError("connection refused"),
+        asyncio.CancelledError(),
+    ]
+
+    with pytest.raises(asyncio.CancelledError):
+        await subscriber.listen_to_events(["meeting-events"])
+
+    assert subscriber.transport.consume.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_subscriber_records_throughput_and_lag(subscriber, test_client):
+    labels = {"channel": "meeting-events", "event_type": "complete"}
+    handled = events_handled_total.get(**labels)
+    failed = events_failed_total.get(**labels)
+    event = EventEnvelope(
+        "complete", "Meeting", {"meeting_id": 1, "next_meeting_id": 2}
+    )
+    event.ts -= 30
+    batch = [
+        (EventEnvelope("complete", "Meeting"), Delivery("meeting-events", "", None)),
+        (event, Delivery("meeting-events", "", None)),
+    ]
+
+    await subscriber._process_batch(batch)  # pylint: disable=protected-access
+
+    assert events_handled_total.get(**labels) == handled + 1
+    assert events_failed_total.get(**labels) == failed + 1
+    assert current_lag_seconds.get(channel="meeting-events") >= 30
+    assert in_flight_gauge.get() == 0
+
+    response = await test_client.get("/metrics")
+    assert 'subscriber_current_lag_seconds{channel="meeting-events"}' in response.text